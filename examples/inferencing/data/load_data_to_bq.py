@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import argparse
-import subprocess
+import json
+import os
 
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
@@ -38,12 +39,23 @@ def load_data(filename: str, project_id: str):
         client.get_table(table_id)
         print(f'Table {table_id} already exists')
     except NotFound:
-        write_table(table_id, filename)
+        write_table(client, table_id, filename)
 
-def write_table(table_id: str, filename: str):
+def write_table(client: bigquery.Client, table_id: str, filename: str):
+    # An explicit schema lets BigQuery load the file in a single pass instead of
+    # scanning it once to infer types; autodetect also conflicts with skip_leading_rows
+    schema_path = os.path.join(os.path.dirname(__file__), 'schema.json')
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        schema = [bigquery.SchemaField(**field) for field in json.load(f)]
+    job_config = bigquery.LoadJobConfig(
+        schema=schema,
+        source_format=bigquery.SourceFormat.CSV,
+        skip_leading_rows=1,
+        autodetect=False)
     try:
-        cmd = f'bq load --skip_leading_rows=1 --autodetect {table_id} {filename}'
-        subprocess.check_output([cmd], shell=True, stderr=subprocess.STDOUT)
+        with open(filename, 'rb') as source_file:
+            job = client.load_table_from_file(source_file, table_id, job_config=job_config)
+        job.result()
         print(f'Uploaded data to table {table_id}')
     except Exception as err:
         raise Exception(f'Error uploading data. {err}') from err
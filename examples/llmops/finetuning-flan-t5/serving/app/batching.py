@@ -0,0 +1,52 @@
+import asyncio
+import logging
+from typing import Callable
+
+async def collect_batch(queue: asyncio.Queue, max_batch_size: int, batch_timeout_ms: float):
+    '''Wait for one queued request, then keep adding requests until the batch holds
+       max_batch_size instances or batch_timeout_ms have passed since the first one
+    '''
+    loop = asyncio.get_running_loop()
+    batch = [await queue.get()]
+    batch_size = len(batch[0][0])
+    deadline = loop.time() + batch_timeout_ms / 1000
+    while batch_size < max_batch_size and loop.time() < deadline:
+        try:
+            item = await asyncio.wait_for(queue.get(), deadline - loop.time())
+        except asyncio.TimeoutError:
+            break
+        batch.append(item)
+        batch_size += len(item[0])
+    return batch
+
+def resolve_batch(batch: list, outputs: list):
+    '''Hand each request its slice of the outputs. Requests whose future is already done
+       (e.g. cancelled because the client disconnected or timed out) are skipped
+    '''
+    start = 0
+    for request_instances, future in batch:
+        if not future.done():
+            future.set_result(outputs[start:start + len(request_instances)])
+        start += len(request_instances)
+
+def fail_batch(batch: list, err: Exception):
+    '''Propagate a generation error to every request of the batch that is still waiting'''
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(err)
+
+async def batch_worker(queue: asyncio.Queue, generate: Callable, max_batch_size: int, batch_timeout_ms: float):
+    '''Drain queued (instances, future) requests into batches and resolve each request's future
+       with its outputs. Errors are handled per batch, so the worker never exits while serving
+    '''
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = await collect_batch(queue, max_batch_size, batch_timeout_ms)
+        try:
+            instances = [instance for request_instances, _ in batch for instance in request_instances]
+            # Run generation off the event loop so new requests keep queueing meanwhile
+            outputs = await loop.run_in_executor(None, generate, instances)
+            resolve_batch(batch, outputs)
+        except Exception as err:  # pylint: disable=broad-except
+            logging.exception('Batch of %d requests failed', len(batch))
+            fail_batch(batch, err)
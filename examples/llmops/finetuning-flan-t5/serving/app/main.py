@@ -1,12 +1,31 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 from google.cloud import storage
 
 from fastapi import FastAPI, Request
-from transformers import AutoTokenizer, T5ForConditionalGeneration
+from fastapi.responses import StreamingResponse
+import torch
+from transformers import AutoTokenizer, T5ForConditionalGeneration, TextIteratorStreamer
+
+from batching import batch_worker
+from streaming import stream_events
 
 BUCKET_NAME = 'PROJECT_ID-MODEL_ID-bucket' # Update with f'{actual_project_id}-{actual_model_id}-bucket'
 OUTPUT_FOLDER = '../model-output-flan-t5-base'
+# Requests are coalesced into one generate() call of up to MAX_BATCH_SIZE instances,
+# waiting at most BATCH_TIMEOUT_MS after the first request for others to arrive
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', '16'))
+BATCH_TIMEOUT_MS = float(os.environ.get('BATCH_TIMEOUT_MS', '10'))
+# Texts are sorted by length and generated in buckets of this size, so each bucket
+# is only padded to its own longest text rather than the longest in the batch
+BUCKET_SIZE = int(os.environ.get('BUCKET_SIZE', '8'))
+# Pin greedy decoding with the KV cache so a generation config saved with the model
+# cannot switch serving to beam search or sampling
+GENERATE_KWARGS = {'max_new_tokens': 50, 'use_cache': True, 'num_beams': 1, 'do_sample': False}
+# A streamed response ends with an error event when no new chunk is decoded within this many seconds
+STREAM_TIMEOUT_S = float(os.environ.get('STREAM_TIMEOUT_S', '60'))
 
 app = FastAPI()
 
@@ -14,34 +33,96 @@ def download_model_artifacts():
     '''Download model artifacts from GCS to local container
        (HuggingFace does not support loading directly from GCS)
     '''
+    # Nothing to fetch when the artifacts were baked into the image or survived a restart
+    weights_files = ('model.safetensors', 'model.safetensors.index.json',
+                     'pytorch_model.bin', 'pytorch_model.bin.index.json')
+    if os.path.isfile(os.path.join(OUTPUT_FOLDER, 'config.json')) and any(
+            os.path.isfile(os.path.join(OUTPUT_FOLDER, weights_file)) for weights_file in weights_files):
+        return
+
     storage_client = storage.Client()
     bucket = storage_client.get_bucket(BUCKET_NAME)
-    for blob in bucket.list_blobs(prefix='model/'):
-        if '.' in blob.name.split('/')[-1]:
-            blob.download_to_filename(OUTPUT_FOLDER + '/' + blob.name.split('/')[-1])
+    blobs = [blob for blob in bucket.list_blobs(prefix='model/') if '.' in blob.name.split('/')[-1]]
+    # The artifacts are independent files, so download them concurrently
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(
+            lambda blob: blob.download_to_filename(OUTPUT_FOLDER + '/' + blob.name.split('/')[-1]), blobs))
 
 download_model_artifacts()
 
+# Serve from the GPU when there is one. T5 overflows in fp16, so the weights are only
+# halved where the GPU supports bf16 and stay fp32 otherwise (e.g. on a V100)
+DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
+DTYPE = torch.bfloat16 if DEVICE == 'cuda' and torch.cuda.is_bf16_supported() else torch.float32
+if DEVICE == 'cpu':
+    torch.set_num_threads(os.cpu_count())
+
+# Load the tokenizer and model once per process; every batch reuses them
+TOKENIZER = AutoTokenizer.from_pretrained(OUTPUT_FOLDER)
+MODEL = T5ForConditionalGeneration.from_pretrained(OUTPUT_FOLDER, torch_dtype=DTYPE).to(DEVICE).eval()
+
 @app.get(os.environ['AIP_HEALTH_ROUTE'], status_code=200)
 def health():
     return {"status": "healthy"}
 
+def generate_in_inference_mode(**kwargs):
+    '''Run MODEL.generate without autograd version tracking.
+       Grad mode is thread-local, so this wraps each call made off the main thread.
+    '''
+    with torch.inference_mode():
+        return MODEL.generate(**kwargs)
+
+def generate(instances):
+    '''Generate one list of decoded outputs per instance'''
+    # Flatten the texts of every instance into one list and generate it in length buckets
+    texts_per_instance = [[instance] if isinstance(instance, str) else list(instance) for instance in instances]
+    texts = [text for instance_texts in texts_per_instance for text in instance_texts]
+    if not texts:
+        return [[] for _ in texts_per_instance]
+
+    encoded = TOKENIZER(texts, truncation=True)
+    order = sorted(range(len(texts)), key=lambda i: len(encoded['input_ids'][i]))
+    decoded = [None] * len(texts)
+    for bucket_start in range(0, len(order), BUCKET_SIZE):
+        bucket = order[bucket_start:bucket_start + BUCKET_SIZE]
+        batch = TOKENIZER.pad({key: [encoded[key][i] for i in bucket] for key in encoded}, return_tensors="pt")
+        generated = generate_in_inference_mode(**batch.to(DEVICE), **GENERATE_KWARGS)
+        for i, text in zip(bucket, TOKENIZER.batch_decode(generated, skip_special_tokens=True)):
+            decoded[i] = text
+
+    outputs = []
+    start = 0
+    for instance_texts in texts_per_instance:
+        outputs.append(decoded[start:start + len(instance_texts)])
+        start += len(instance_texts)
+    return outputs
+
+@app.on_event('startup')
+async def start_batch_worker():
+    app.state.queue = asyncio.Queue()
+    app.state.batch_worker = asyncio.create_task(
+        batch_worker(app.state.queue, generate, MAX_BATCH_SIZE, BATCH_TIMEOUT_MS))
+
 @app.post(os.environ['AIP_PREDICT_ROUTE'])
 async def predict(request: Request):
     body = await request.json()
 
     instances = body["instances"]
 
-    # Load tokenizer
-    tokenizer = AutoTokenizer.from_pretrained(OUTPUT_FOLDER)
+    future = asyncio.get_running_loop().create_future()
+    await app.state.queue.put((instances, future))
+    outputs = await future
 
-    # Load model
-    model = T5ForConditionalGeneration.from_pretrained(OUTPUT_FOLDER)
+    return {"predictions": [outputs]}
 
-    outputs = []
-    for instance in instances:
+@app.post(os.environ['AIP_PREDICT_ROUTE'] + '/stream')
+def predict_stream(body: dict):
+    '''Stream the summary of the first instance as server-sent events, one per decoded chunk'''
+    instance = body["instances"][0]
+    text = instance if isinstance(instance, str) else instance[0]
 
-        generated = model.generate(**tokenizer(instance, return_tensors="pt", padding=True), max_new_tokens=50)
-        outputs.append([tokenizer.decode(t, skip_special_tokens=True) for t in generated])
+    streamer = TextIteratorStreamer(TOKENIZER, skip_special_tokens=True, timeout=STREAM_TIMEOUT_S)
+    inputs = TOKENIZER([text], return_tensors="pt", truncation=True).to(DEVICE)
 
-    return {"predictions": [outputs]}
+    return StreamingResponse(stream_events(generate_in_inference_mode, streamer, **inputs, **GENERATE_KWARGS),
+                             media_type="text/event-stream")
@@ -0,0 +1,30 @@
+import logging
+import queue
+from threading import Thread
+from typing import Callable, Iterator
+
+def stream_events(generate: Callable, streamer, **generate_kwargs) -> Iterator[str]:
+    '''Run generate(streamer=streamer, **generate_kwargs) in a background thread and yield each
+       decoded chunk as a server-sent event. The streamer must have been created with a timeout,
+       so a stalled generation ends the stream with an error event instead of hanging it
+    '''
+    errors = []
+
+    def run():
+        try:
+            generate(streamer=streamer, **generate_kwargs)
+        except Exception as err:  # pylint: disable=broad-except
+            logging.exception('Streaming generation failed')
+            errors.append(err)
+            # Unblock the iterator right away rather than letting it wait for the timeout
+            streamer.end()
+
+    Thread(target=run, daemon=True).start()
+    try:
+        for chunk in streamer:
+            yield f"data: {chunk}\n\n"
+    except queue.Empty:
+        yield "event: error\ndata: generation timed out\n\n"
+        return
+    if errors:
+        yield f"event: error\ndata: {errors[0]}\n\n"
@@ -0,0 +1,71 @@
+"""Unit tests for the request batching of the Flan-T5 serving container."""
+
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from batching import batch_worker  # pylint: disable=wrong-import-position
+
+
+def test_batch_worker_survives_cancelled_request():
+    """Tests that cancelling a request while its batch is generating neither breaks the other
+    requests of that batch nor stops the worker from serving later requests."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def generate(instances):
+        started.set()
+        release.wait(timeout=5)
+        return [instance.upper() for instance in instances]
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        worker = asyncio.create_task(batch_worker(queue, generate, max_batch_size=16, batch_timeout_ms=10))
+
+        cancelled, kept = loop.create_future(), loop.create_future()
+        await queue.put((['a'], cancelled))
+        await queue.put((['b', 'c'], kept))
+        await loop.run_in_executor(None, started.wait, 5)
+        cancelled.cancel()
+        release.set()
+        assert await asyncio.wait_for(kept, 5) == ['B', 'C']
+
+        later = loop.create_future()
+        await queue.put((['d'], later))
+        assert await asyncio.wait_for(later, 5) == ['D']
+        assert not worker.done()
+        worker.cancel()
+
+    asyncio.run(run())
+
+
+def test_batch_worker_survives_generation_error():
+    """Tests that a failing batch fails only its own requests and the worker keeps running."""
+    def generate(instances):
+        if 'bad' in instances:
+            raise ValueError('generation failed')
+        return instances
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        worker = asyncio.create_task(batch_worker(queue, generate, max_batch_size=1, batch_timeout_ms=10))
+
+        failed = loop.create_future()
+        await queue.put((['bad'], failed))
+        try:
+            await asyncio.wait_for(failed, 5)
+            assert False, 'expected the request to fail'
+        except ValueError:
+            pass
+
+        later = loop.create_future()
+        await queue.put((['good'], later))
+        assert await asyncio.wait_for(later, 5) == ['good']
+        worker.cancel()
+
+    asyncio.run(run())
@@ -0,0 +1,71 @@
+"""Unit tests for the streamed predictions of the Flan-T5 serving container."""
+
+import os
+import queue
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from streaming import stream_events  # pylint: disable=wrong-import-position
+
+
+class FakeStreamer:
+    """Mirrors the queue behaviour of transformers.TextIteratorStreamer: put() queues a chunk,
+    end() stops the iteration, and waiting longer than timeout raises queue.Empty."""
+
+    stop_signal = object()
+
+    def __init__(self, timeout: float):
+        self.chunks = queue.Queue()
+        self.timeout = timeout
+
+    def put(self, chunk: str):
+        self.chunks.put(chunk)
+
+    def end(self):
+        self.chunks.put(self.stop_signal)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = self.chunks.get(timeout=self.timeout)
+        if chunk is self.stop_signal:
+            raise StopIteration()
+        return chunk
+
+
+def test_stream_events():
+    """Tests that every chunk is sent as an event and the stream closes when generation ends."""
+    def generate(streamer, words):
+        for word in words:
+            streamer.put(word)
+        streamer.end()
+
+    events = list(stream_events(generate, FakeStreamer(timeout=5), words=['a', 'b']))
+    assert events == ['data: a\n\n', 'data: b\n\n']
+
+
+def test_stream_events_generation_error():
+    """Tests that a failing generation closes the stream with an error event instead of leaving
+    the iterator waiting."""
+    def generate(streamer):
+        streamer.put('a')
+        raise ValueError('generation failed')
+
+    events = list(stream_events(generate, FakeStreamer(timeout=5)))
+    assert events == ['data: a\n\n', 'event: error\ndata: generation failed\n\n']
+
+
+def test_stream_events_timeout():
+    """Tests that a generation that stalls ends the stream with an error event once the
+    streamer's timeout passes."""
+    release = threading.Event()
+
+    def generate(streamer):
+        release.wait(timeout=5)
+
+    events = list(stream_events(generate, FakeStreamer(timeout=0.1)))
+    release.set()
+    assert events == ['event: error\ndata: generation timed out\n\n']
@@ -71,6 +71,7 @@ from google_cloud_automlops import AutoMLOps
 @AutoMLOps.component(
     packages_to_install=[
         'google-cloud-bigquery', 
+        'google-cloud-bigquery-storage',
         'pandas',
         'pyarrow',
         'db_dtypes',
@@ -117,13 +118,15 @@ def create_dataset(
         Returns:
         pd.DataFrame: A dataframe with the requested data.
         """
-        df = client.query(query).to_dataframe()
+        # Stream the result as Arrow over the BigQuery Storage Read API rather than REST pages
+        df = client.query(query).to_dataframe(create_bqstorage_client=True)
         return df
 
     dataframe = load_bq_data(get_query(bq_table), bq_client)
     le = preprocessing.LabelEncoder()
     dataframe['Class'] = le.fit_transform(dataframe['Class'])
-    dataframe.to_csv(data_path)
+    # The CSV is only ever read back by train_model, so compress it to cut the GCS transfer both ways
+    dataframe.to_csv(data_path, index=False, compression='gzip')
 
 
 # ## Model Training
@@ -134,7 +137,7 @@ def create_dataset(
         'scikit-learn==1.3.2',
         'pandas',
         'joblib',
-        'tensorflow'
+        'google-cloud-storage'
     ]
 )
 def train_model(
@@ -149,21 +152,39 @@ def train_model(
     """
     from sklearn.tree import DecisionTreeClassifier
     from sklearn.model_selection import train_test_split
+    import numpy as np
     import pandas as pd
-    import tensorflow as tf
-    import pickle
     import os
 
     def save_model(model, uri):
-        """Saves a model to uri."""
-        with tf.io.gfile.GFile(uri, 'w') as f:
-            pickle.dump(model, f)
-
-    df = pd.read_csv(data_path)
-    labels = df.pop('Class').tolist()
-    data = df.values.tolist()
+        """Saves a model to uri, skipping the upload if identical bytes are already there."""
+        # Only needed for the GCS write, so defer the import cost until the model is trained
+        import base64
+        import hashlib
+        import pickle
+        from google.cloud import storage
+
+        payload = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        bucket_name, blob_name = uri.removeprefix('gs://').split('/', 1)
+        bucket = storage.Client().bucket(bucket_name)
+        existing = bucket.get_blob(blob_name)
+        md5_hash = base64.b64encode(hashlib.md5(payload).digest()).decode()
+        if existing is not None and existing.md5_hash == md5_hash:
+            print(f'{uri} already holds this model, skipping upload')
+            return
+        # Only replace the generation we looked at, so concurrent runs cannot clobber each other
+        bucket.blob(blob_name).upload_from_string(
+            payload, if_generation_match=existing.generation if existing else 0)
+
+    df = pd.read_csv(data_path, compression='gzip')
+    labels = df.pop('Class').to_numpy()
+    data = df.to_numpy(dtype=np.float32)
     x_train, x_test, y_train, y_test = train_test_split(data, labels)
-    skmodel = DecisionTreeClassifier()
+    # The tree builder works on C-contiguous float32, so hand it that layout and skip its input copy
+    x_train = np.ascontiguousarray(x_train, dtype=np.float32)
+    x_test = np.ascontiguousarray(x_test, dtype=np.float32)
+    # Evaluate sqrt(n_features) candidate features per split instead of all of them
+    skmodel = DecisionTreeClassifier(max_features='sqrt')
     skmodel.fit(x_train,y_train)
     score = skmodel.score(x_test,y_test)
     print('accuracy is:',score)
@@ -196,13 +217,19 @@ def deploy_model(
     import pprint as pp
     import random
 
+    from google.api_core.exceptions import NotFound
     from google.cloud import aiplatform
 
     aiplatform.init(project=project_id, location=region)
-    # Check if model exists
-    models = aiplatform.Model.list()
+    # Check if model exists; it is created with model_id=model_name, so a single
+    # get by id replaces listing every model in the project
     model_name = 'beans-model'
-    if 'beans-model' in (m.name for m in models):
+    try:
+        aiplatform.Model(model_name)
+        model_exists = True
+    except NotFound:
+        model_exists = False
+    if model_exists:
         parent_model = model_name
         model_id = None
         is_default_version=False
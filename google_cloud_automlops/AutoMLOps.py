@@ -18,16 +18,23 @@
 # pylint: disable=inconsistent-return-statements
 # pylint: disable=line-too-long
 # pylint: disable=unused-import
-# pylint: disable=logging-fstring-interpolation
+# pylint: disable=import-outside-toplevel
 # pylint: disable=global-at-module-level
 # pylint: disable=global-variable-undefined
 # pylint: disable=too-many-positional-arguments
 
+import collections
+import copy
 import functools
+import hashlib
+import importlib
+import inspect
+import json
 import logging
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional
 
 from google_cloud_automlops.utils.constants import (
@@ -40,30 +47,38 @@ from google_cloud_automlops.utils.constants import (
     DEFAULT_VPC_CONNECTOR,
     DEFAULTS_HEADER,
     GENERATED_CLOUDBUILD_FILE,
+    GENERATED_COMPONENT_BASE_SRC,
     GENERATED_GITHUB_ACTIONS_FILE,
     GENERATED_DEFAULTS_FILE,
+    GENERATED_DIGEST_FILE,
+    GENERATED_STAMPS_DIR,
     GENERATED_DIRS,
     GENERATED_GITHUB_DIRS,
     GENERATED_MODEL_MONITORING_DIRS,
+    GENERATED_MODEL_MONITORING_MONITOR_PY_FILE,
+    GENERATED_PIPELINE_FILE,
+    GENERATED_PIPELINE_RUNNER_FILE,
     GENERATED_RESOURCES_SH_FILE,
+    GENERATED_RUN_ALL_SH_FILE,
     GENERATED_SERVICES_DIRS,
     GENERATED_TERRAFORM_DIRS,
 )
 from google_cloud_automlops.utils.utils import (
     account_permissions_warning,
     check_installation_versions,
-    coalesce,
-    create_default_config,
+    create_default_config_from_dict,
+    dump_yaml,
     execute_process,
     git_workflow,
     make_dirs,
     precheck_deployment_requirements,
+    read_file,
     read_yaml_file,
     resources_generation_manifest,
     stringify_job_spec_list,
     validate_use_ci,
     write_file,
-    write_yaml_file
+    write_file_if_changed
 )
 # Orchestration imports
 from google_cloud_automlops.utils.enums import (
@@ -75,17 +90,59 @@ from google_cloud_automlops.utils.enums import (
     Provisioner
 )
 from google_cloud_automlops.orchestration.base import BaseComponent, BasePipeline, BaseServices
-from google_cloud_automlops.orchestration.kfp import KFPComponent, KFPPipeline, KFPServices
 
-# Provisioning imports
-from google_cloud_automlops.provisioning.base import Infrastructure
-from google_cloud_automlops.provisioning.terraform import Terraform
-from google_cloud_automlops.provisioning.gcloud import GCloud
-from google_cloud_automlops.provisioning.pulumi import Pulumi
+# Framework-specific builders are imported lazily, only once the chosen orchestration,
+# provisioning, or deployment framework actually needs them. The public names remain
+# available as module attributes through __getattr__ below.
+_LAZY_IMPORTS = {
+    'KFPComponent': 'google_cloud_automlops.orchestration.kfp',
+    'KFPPipeline': 'google_cloud_automlops.orchestration.kfp',
+    'KFPServices': 'google_cloud_automlops.orchestration.kfp',
+    'Infrastructure': 'google_cloud_automlops.provisioning.base',
+    'Terraform': 'google_cloud_automlops.provisioning.terraform',
+    'GCloud': 'google_cloud_automlops.provisioning.gcloud',
+    'Pulumi': 'google_cloud_automlops.provisioning.pulumi',
+    'CloudBuild': 'google_cloud_automlops.deployments.cloudbuild',
+    'GitHubActions': 'google_cloud_automlops.deployments.github_actions'
+}
 
-# Deployment imports
-from google_cloud_automlops.deployments.cloudbuild import CloudBuild
-from google_cloud_automlops.deployments.github_actions import GitHubActions
+
+def __getattr__(name: str):
+    """Resolves the lazily imported builder classes on first attribute access.
+
+    Args:
+        name: The attribute name being looked up on this module.
+
+    Returns:
+        Any: The requested builder class.
+
+    Raises:
+        AttributeError: If the name is not a known lazily imported attribute.
+    """
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+# Supported values for each tooling option, used to validate the arguments to generate()
+_SUPPORTED_VALUES = {
+    enum: frozenset(e.value for e in enum)
+    for enum in (ArtifactRepository, CodeRepository, PipelineJobSubmitter, Orchestrator, Provisioner, Deployer)
+}
+
+# Default resource names, used when the corresponding generate() argument is not given
+_DERIVED_NAME_TEMPLATES = {
+    'artifact_repo_name': '{naming_prefix}-artifact-registry',
+    'build_trigger_name': '{naming_prefix}-build-trigger',
+    'pipeline_job_runner_service_account': 'vertex-pipelines@{project_id}.iam.gserviceaccount.com',
+    'pipeline_job_submission_service_name': '{naming_prefix}-job-submission-svc',
+    'pubsub_topic_name': '{naming_prefix}-queueing-svc',
+    'schedule_name': '{naming_prefix}-schedule',
+    'source_repo_name': '{naming_prefix}-repository',
+    'storage_bucket_name': '{project_id}-{naming_prefix}-bucket'
+}
+_DerivedNames = collections.namedtuple('_DerivedNames', _DERIVED_NAME_TEMPLATES)
 
 # Set up logging
 logging.basicConfig(stream=sys.stdout, level=logging.INFO,
@@ -96,6 +153,10 @@ logger = logging.getLogger()
 # Set up global dictionaries to hold pipeline and components
 global components_dict
 components_dict = {}
+# Component and pipeline objects keyed on the decorated function's source and the decorator
+# arguments, so re-running an unchanged notebook cell reuses the existing object instead of
+# re-parsing the function
+_scaffold_cache = {}
 # # Set up global pipeline glob
 # global pipeline_glob
 # pipeline_glob = None
@@ -180,44 +241,10 @@ def launchAll(
         workload_identity_provider: Provider for workload identity federation.
         workload_identity_service_account: Service account for workload identity federation (specify the full string).
     """
-    generate(
-        project_id=project_id,
-        pipeline_params=pipeline_params,
-        artifact_repo_location=artifact_repo_location,
-        artifact_repo_name=artifact_repo_name,
-        artifact_repo_type=artifact_repo_type,
-        base_image=base_image,
-        build_trigger_location=build_trigger_location,
-        build_trigger_name=build_trigger_name,
-        custom_training_job_specs=custom_training_job_specs,
-        deployment_framework=deployment_framework,
-        naming_prefix=naming_prefix,
-        orchestration_framework=orchestration_framework,
-        pipeline_job_location=pipeline_job_location,
-        pipeline_job_runner_service_account=pipeline_job_runner_service_account,
-        pipeline_job_submission_service_location=pipeline_job_submission_service_location,
-        pipeline_job_submission_service_name=pipeline_job_submission_service_name,
-        pipeline_job_submission_service_type=pipeline_job_submission_service_type,
-        project_number=project_number,
-        provisioning_framework=provisioning_framework,
-        provision_credentials_key=provision_credentials_key,
-        pubsub_topic_name=pubsub_topic_name,
-        schedule_location=schedule_location,
-        schedule_name=schedule_name,
-        schedule_pattern=schedule_pattern,
-        setup_model_monitoring=setup_model_monitoring,
-        source_repo_branch=source_repo_branch,
-        source_repo_name=source_repo_name,
-        source_repo_type=source_repo_type,
-        storage_bucket_location=storage_bucket_location,
-        storage_bucket_name=storage_bucket_name,
-        use_ci=use_ci,
-        vpc_connector=vpc_connector,
-        workload_identity_pool=workload_identity_pool,
-        workload_identity_provider=workload_identity_provider,
-        workload_identity_service_account=workload_identity_service_account)
-    provision(hide_warnings=hide_warnings)
-    deploy(hide_warnings=hide_warnings, precheck=precheck)
+    # Every argument except the launch-only ones is forwarded to generate() as is
+    defaults = generate(**{k: v for k, v in locals().items() if k not in ('hide_warnings', 'precheck')})
+    provision(hide_warnings=hide_warnings, defaults=defaults)
+    deploy(hide_warnings=hide_warnings, precheck=precheck, defaults=defaults)
 
 
 def generate(
@@ -255,12 +282,29 @@ def generate(
     vpc_connector: Optional[str] = DEFAULT_VPC_CONNECTOR,
     workload_identity_pool: Optional[str] = None, #TODO: integrate optional creation of pool and provider during provisioning stage
     workload_identity_provider: Optional[str] = None,
-    workload_identity_service_account: Optional[str] = None):
+    workload_identity_service_account: Optional[str] = None,
+    force: Optional[bool] = False,
+    parallel: Optional[bool] = True):
     """Generates relevant pipeline and component artifacts. Check constants file for variable
-    default values.
+    default values. If the arguments, the registered components and pipeline, and the AutoMLOps
+    package itself are unchanged since the last successful run, and that run's output (including
+    an unmodified config/defaults.yaml) is still in place, the existing output is kept.
 
-    Args: See launchAll() function.
+    Args:
+        force: Boolean that specifies whether to regenerate even if nothing changed.
+        parallel: Boolean that specifies whether to run the code builders concurrently. Set to
+            False to run them one after another, e.g. for debugging.
+        See launchAll() function for the remaining arguments.
+
+    Returns:
+        dict: The configuration written to config/defaults.yaml.
     """
+    package_digest = _get_package_digest()
+    generate_args = {k: v for k, v in locals().items() if k not in ('force', 'parallel', 'package_digest')}
+    credentials_key_input = _get_credentials_key_input(provision_credentials_key)
+    generate_args['provision_credentials_key'] = credentials_key_input
+    generate_digest = _get_generate_digest(generate_args, package_digest)
+
     # Validate that use_ci=True if schedule_pattern parameter is set or setup_model_monitoring is True
     validate_use_ci(deployment_framework,
                     setup_model_monitoring,
@@ -269,157 +313,511 @@ def generate(
                     use_ci)
 
     # Validate currently supported tools
-    if artifact_repo_type not in [e.value for e in ArtifactRepository]:
-        raise ValueError(
-            f'Unsupported artifact repository type: {artifact_repo_type}. \
-            Supported frameworks include: {", ".join([e.value for e in ArtifactRepository])}'
-        )
-    if source_repo_type not in [e.value for e in CodeRepository]:
-        raise ValueError(
-            f'Unsupported source repository type: {source_repo_type}. \
-            Supported frameworks include: {", ".join([e.value for e in CodeRepository])}'
-        )
-    if pipeline_job_submission_service_type not in [e.value for e in PipelineJobSubmitter]:
-        raise ValueError(
-            f'Unsupported pipeline job submissions service type: {pipeline_job_submission_service_type}. \
-            Supported frameworks include: {", ".join([e.value for e in PipelineJobSubmitter])}'
-        )
-    if orchestration_framework not in [e.value for e in Orchestrator]:
-        raise ValueError(
-            f'Unsupported orchestration framework: {orchestration_framework}. \
-            Supported frameworks include: {", ".join([e.value for e in Orchestrator])}'
-        )
-    if provisioning_framework not in [e.value for e in Provisioner]:
-        raise ValueError(
-            f'Unsupported provisioning framework: {provisioning_framework}. \
-            Supported frameworks include: {", ".join([e.value for e in Provisioner])}'
-        )
-    if deployment_framework not in [e.value for e in Deployer]:
-        raise ValueError(
-            f'Unsupported deployment framework: {deployment_framework}. \
-            Supported frameworks include: {", ".join([e.value for e in Deployer])}'
-        )
+    for value, label, enum in (
+            (artifact_repo_type, 'artifact repository type', ArtifactRepository),
+            (source_repo_type, 'source repository type', CodeRepository),
+            (pipeline_job_submission_service_type, 'pipeline job submissions service type', PipelineJobSubmitter),
+            (orchestration_framework, 'orchestration framework', Orchestrator),
+            (provisioning_framework, 'provisioning framework', Provisioner),
+            (deployment_framework, 'deployment framework', Deployer)):
+        if value not in _SUPPORTED_VALUES[enum]:
+            raise ValueError(
+                f'Unsupported {label}: {value}. \
+            Supported frameworks include: {", ".join([e.value for e in enum])}'
+            )
+
+    # Skip code generation if the inputs are unchanged and the previous output is still in place
+    generated_outputs = _get_generated_outputs(orchestration_framework,
+                                               provisioning_framework,
+                                               deployment_framework,
+                                               use_ci,
+                                               setup_model_monitoring)
+    if not force and generate_digest is not None and _is_generation_current(generate_digest, generated_outputs):
+        logging.info('Inputs unchanged since the last generate(), skipping code generation.')
+        return _read_defaults()
 
     # Make standard directories
-    logging.info(f'Writing directories under {BASE_DIR}')
-    make_dirs(GENERATED_DIRS)
+    logging.info('Writing directories under %s', BASE_DIR)
+    dirs_to_create = GENERATED_DIRS + [GENERATED_STAMPS_DIR]
 
     # Make optional directories
     if use_ci:
-        make_dirs(GENERATED_SERVICES_DIRS)
+        dirs_to_create += GENERATED_SERVICES_DIRS
     if provisioning_framework == Provisioner.TERRAFORM.value:
-        make_dirs(GENERATED_TERRAFORM_DIRS)
+        dirs_to_create += GENERATED_TERRAFORM_DIRS
     if deployment_framework == Deployer.GITHUB_ACTIONS.value:
-        make_dirs(GENERATED_GITHUB_DIRS)
+        dirs_to_create += GENERATED_GITHUB_DIRS
     if setup_model_monitoring:
-        make_dirs(GENERATED_MODEL_MONITORING_DIRS)
+        dirs_to_create += GENERATED_MODEL_MONITORING_DIRS
+    make_dirs(dirs_to_create)
 
     # Set derived vars if none were given for certain variables
-    derived_artifact_repo_name = coalesce(artifact_repo_name, f'{naming_prefix}-artifact-registry')
-    derived_build_trigger_name = coalesce(build_trigger_name, f'{naming_prefix}-build-trigger')
+    derived_names = _derive_resource_names(
+        naming_prefix=naming_prefix,
+        project_id=project_id,
+        artifact_repo_name=artifact_repo_name,
+        build_trigger_name=build_trigger_name,
+        pipeline_job_runner_service_account=pipeline_job_runner_service_account,
+        pipeline_job_submission_service_name=pipeline_job_submission_service_name,
+        pubsub_topic_name=pubsub_topic_name,
+        schedule_name=schedule_name,
+        source_repo_name=source_repo_name,
+        storage_bucket_name=storage_bucket_name)
     derived_custom_training_job_specs = stringify_job_spec_list(custom_training_job_specs)
-    derived_pipeline_job_runner_service_account = coalesce(pipeline_job_runner_service_account, f'vertex-pipelines@{project_id}.iam.gserviceaccount.com')
-    derived_pipeline_job_submission_service_name = coalesce(pipeline_job_submission_service_name, f'{naming_prefix}-job-submission-svc')
-    derived_pubsub_topic_name = coalesce(pubsub_topic_name, f'{naming_prefix}-queueing-svc')
-    derived_schedule_name = coalesce(schedule_name, f'{naming_prefix}-schedule')
-    derived_source_repo_name = coalesce(source_repo_name, f'{naming_prefix}-repository')
-    derived_storage_bucket_name = coalesce(storage_bucket_name, f'{project_id}-{naming_prefix}-bucket')
 
     # Write defaults.yaml
-    logging.info(f'Writing configurations to {GENERATED_DEFAULTS_FILE}')
-    defaults = create_default_config(
-        artifact_repo_location=artifact_repo_location,
-        artifact_repo_name=derived_artifact_repo_name,
-        artifact_repo_type=artifact_repo_type,
-        base_image=base_image,
-        build_trigger_location=build_trigger_location,
-        build_trigger_name=derived_build_trigger_name,
-        deployment_framework=deployment_framework,
-        naming_prefix=naming_prefix,
-        orchestration_framework=orchestration_framework,
-        pipeline_job_location=pipeline_job_location,
-        pipeline_job_runner_service_account=derived_pipeline_job_runner_service_account,
-        pipeline_job_submission_service_location=pipeline_job_submission_service_location,
-        pipeline_job_submission_service_name=derived_pipeline_job_submission_service_name,
-        pipeline_job_submission_service_type=pipeline_job_submission_service_type,
-        project_id=project_id,
-        provisioning_framework=provisioning_framework,
-        pubsub_topic_name=derived_pubsub_topic_name,
-        schedule_location=schedule_location,
-        schedule_name=derived_schedule_name,
-        schedule_pattern=schedule_pattern,
-        setup_model_monitoring=setup_model_monitoring,
-        source_repo_branch=source_repo_branch,
-        source_repo_name=derived_source_repo_name,
-        source_repo_type=source_repo_type,
-        storage_bucket_location=storage_bucket_location,
-        storage_bucket_name=derived_storage_bucket_name,
-        use_ci=use_ci,
-        vpc_connector=vpc_connector)
-    write_file(GENERATED_DEFAULTS_FILE, DEFAULTS_HEADER, 'w')
-    write_yaml_file(GENERATED_DEFAULTS_FILE, defaults, 'a')
+    logging.info('Writing configurations to %s', GENERATED_DEFAULTS_FILE)
+    defaults = create_default_config_from_dict({
+        'artifact_repo_location': artifact_repo_location,
+        'artifact_repo_name': derived_names.artifact_repo_name,
+        'artifact_repo_type': artifact_repo_type,
+        'base_image': base_image,
+        'build_trigger_location': build_trigger_location,
+        'build_trigger_name': derived_names.build_trigger_name,
+        'deployment_framework': deployment_framework,
+        'naming_prefix': naming_prefix,
+        'orchestration_framework': orchestration_framework,
+        'pipeline_job_location': pipeline_job_location,
+        'pipeline_job_runner_service_account': derived_names.pipeline_job_runner_service_account,
+        'pipeline_job_submission_service_location': pipeline_job_submission_service_location,
+        'pipeline_job_submission_service_name': derived_names.pipeline_job_submission_service_name,
+        'pipeline_job_submission_service_type': pipeline_job_submission_service_type,
+        'project_id': project_id,
+        'provisioning_framework': provisioning_framework,
+        'pubsub_topic_name': derived_names.pubsub_topic_name,
+        'schedule_location': schedule_location,
+        'schedule_name': derived_names.schedule_name,
+        'schedule_pattern': schedule_pattern,
+        'setup_model_monitoring': setup_model_monitoring,
+        'source_repo_branch': source_repo_branch,
+        'source_repo_name': derived_names.source_repo_name,
+        'source_repo_type': source_repo_type,
+        'storage_bucket_location': storage_bucket_location,
+        'storage_bucket_name': derived_names.storage_bucket_name,
+        'use_ci': use_ci,
+        'vpc_connector': vpc_connector
+    })
+    _write_defaults(defaults)
+
+    # The orchestration, provisioning, and deployment builders write to disjoint parts of the
+    # generated tree and only read the defaults written above, which are handed to each of them
+    # rather than re-read from disk, so they are run concurrently.
+    # Each builder is skipped if its own inputs are unchanged since its last successful run.
+    builders = []
+    skip_if_unchanged = functools.partial(
+        _skip_if_unchanged,
+        generated_outputs=generated_outputs,
+        defaults=defaults,
+        package_digest=package_digest,
+        force=force)
 
     # Generate files required to run a Kubeflow pipeline
     if orchestration_framework == Orchestrator.KFP.value:
-
-        # Write kubeflow pipeline code
-        logging.info(f'Writing kubeflow pipelines code to {BASE_DIR}pipelines')
-        kfppipe = KFPPipeline(func=pipeline_glob.func,
-                              name=pipeline_glob.name,
-                              description=pipeline_glob.description,
-                              comps_dict=components_dict)
-        kfppipe.build(pipeline_params, derived_custom_training_job_specs)
-
-        # Write kubeflow components code
-        logging.info(f'Writing kubeflow components code to {BASE_DIR}components')
-        for comp in kfppipe.comps:
-            logging.info(f'     -- Writing {comp.name}')
-            KFPComponent(func=comp.func, packages_to_install=comp.packages_to_install).build()
-
-        # If user specified services, write services scripts
-        if use_ci:
-            logging.info(f'Writing submission service code to {BASE_DIR}services')
-            KFPServices().build()
+        pipe = globals().get('pipeline_glob')
+        builders.append(skip_if_unchanged(
+            'kfp',
+            [pipeline_params, derived_custom_training_job_specs, use_ci,
+             [(comp.name, comp.src_code, comp.packages_to_install) for comp in components_dict.values()],
+             None if pipe is None else (pipe.name, pipe.description, pipe.src_code)],
+            functools.partial(_build_kfp, pipeline_params, derived_custom_training_job_specs, use_ci, defaults)))
 
     # Generate files required to provision resources
     if provisioning_framework == Provisioner.GCLOUD.value:
-        logging.info(f'Writing gcloud provisioning code to {BASE_DIR}provision')
-        GCloud(provision_credentials_key=provision_credentials_key).build()
+        from google_cloud_automlops.provisioning.gcloud import GCloud
+        logging.info('Writing gcloud provisioning code to %sprovision', BASE_DIR)
+        builders.append(skip_if_unchanged(
+            'gcloud', [credentials_key_input],
+            lambda: GCloud(provision_credentials_key=provision_credentials_key, defaults=defaults).build()))
 
     elif provisioning_framework == Provisioner.TERRAFORM.value:
-        logging.info(f'Writing terraform provisioning code to {BASE_DIR}provision')
-        Terraform(provision_credentials_key=provision_credentials_key).build()
+        from google_cloud_automlops.provisioning.terraform import Terraform
+        logging.info('Writing terraform provisioning code to %sprovision', BASE_DIR)
+        builders.append(skip_if_unchanged(
+            'terraform', [credentials_key_input],
+            lambda: Terraform(provision_credentials_key=provision_credentials_key, defaults=defaults).build()))
 
     # Pulumi - Currently a roadmap item
     # elif provisioning_framework == Provisioner.PULUMI.value:
-    #     Pulumi(provision_credentials_key=provision_credentials_key).build()
+    #     builders.append(Pulumi(provision_credentials_key=provision_credentials_key).build)
 
     # Generate files required to run cicd pipeline
     if deployment_framework == Deployer.CLOUDBUILD.value:
-        logging.info(f'Writing cloud build config to {GENERATED_CLOUDBUILD_FILE}')
-        CloudBuild().build()
+        from google_cloud_automlops.deployments.cloudbuild import CloudBuild
+        logging.info('Writing cloud build config to %s', GENERATED_CLOUDBUILD_FILE)
+        builders.append(skip_if_unchanged('cloudbuild', [], lambda: CloudBuild(defaults=defaults).build()))
 
     elif deployment_framework == Deployer.GITHUB_ACTIONS.value:
         if project_number is None:
             raise ValueError('Project number must be specified in order to use to use Github Actions integration.')
-        logging.info(f'Writing GitHub Actions config to {GENERATED_GITHUB_ACTIONS_FILE}')
-        GitHubActions(
-            project_number=project_number,
-            workload_identity_pool=workload_identity_pool,
-            workload_identity_provider=workload_identity_provider,
-            workload_identity_service_account=workload_identity_service_account
-        ).build()
+        from google_cloud_automlops.deployments.github_actions import GitHubActions
+        logging.info('Writing GitHub Actions config to %s', GENERATED_GITHUB_ACTIONS_FILE)
+        builders.append(skip_if_unchanged(
+            'github_actions',
+            [project_number, workload_identity_pool, workload_identity_provider, workload_identity_service_account],
+            lambda: GitHubActions(
+                project_number=project_number,
+                workload_identity_pool=workload_identity_pool,
+                workload_identity_provider=workload_identity_provider,
+                workload_identity_service_account=workload_identity_service_account,
+                defaults=defaults
+            ).build()))
+
+    if parallel and len(builders) > 1:
+        with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+            futures = [executor.submit(build) for build in builders]
+        for future in futures:
+            future.result()
+    else:
+        for build in builders:
+            build()
+    if generate_digest is not None:
+        write_file(GENERATED_DIGEST_FILE, _get_generation_state(generate_digest), 'w')
     logging.info('Code Generation Complete.')
+    return defaults
+
+
+@functools.lru_cache(maxsize=None)
+def _get_package_digest() -> str:
+    """Hashes the path, mtime, and size of every file in the installed AutoMLOps package, so that
+    upgrading the package invalidates previously generated code. The package does not change while
+    it is imported, so the walk is done once per process.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for filename in sorted(files):
+            stat = os.stat(os.path.join(root, filename))
+            digest.update(f'{root}/{filename}:{stat.st_mtime_ns}:{stat.st_size}'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _get_generate_digest(generate_args: dict, package_digest: str) -> Optional[str]:
+    """Hashes everything the output of generate() depends on: its arguments, the registered
+    components and pipeline, and the files of the installed AutoMLOps package.
+
+    Args:
+        generate_args: The arguments passed to generate().
+        package_digest: The digest of the AutoMLOps package, see _get_package_digest().
+
+    Returns:
+        Optional[str]: The hex digest, or None if the arguments cannot be serialized.
+    """
+    try:
+        serialized_args = json.dumps(generate_args, sort_keys=True, default=str)
+    except TypeError:
+        return None
+    digest = hashlib.sha256(serialized_args.encode('utf-8'))
+    for comp in components_dict.values():
+        digest.update(repr((comp.name, comp.src_code, comp.packages_to_install)).encode('utf-8'))
+    pipe = globals().get('pipeline_glob')
+    if pipe is not None:
+        digest.update(repr((pipe.name, pipe.description, pipe.src_code)).encode('utf-8'))
+    digest.update(package_digest.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _get_file_digest(filepath: str) -> Optional[str]:
+    """Hashes the contents of a file.
+
+    Args:
+        filepath: Path to the file.
+
+    Returns:
+        Optional[str]: The hex digest, or None if the file cannot be read.
+    """
+    try:
+        with open(filepath, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _get_pipeline_component_names() -> List[str]:
+    """Lists the registered components the pipeline calls. Only these are written by
+    _build_kfp; components that are registered but unused get no generated files.
+
+    Returns:
+        List[str]: The component names, without duplicates, in the order the pipeline uses them.
+    """
+    pipe = globals().get('pipeline_glob')
+    if pipe is None:
+        return []
+    comps = pipe.get_pipeline_components(pipe.func, components_dict)
+    return list(dict.fromkeys(comp.name for comp in comps))
+
+
+def _get_generated_outputs(orchestration_framework: str,
+                           provisioning_framework: str,
+                           deployment_framework: str,
+                           use_ci: bool,
+                           setup_model_monitoring: bool) -> Dict[str, List[str]]:
+    """Lists the key files written by each builder generate() runs for the given tooling. If any
+    of them is missing, the builder's previous output is considered incomplete.
+
+    Args:
+        orchestration_framework: The orchestration framework to use (e.g. kfp, tfx, etc.)
+        provisioning_framework: The IaC tool to use (e.g. Terraform, Pulumi, etc.)
+        deployment_framework: The CI tool to use (e.g. cloud build, github actions, etc.)
+        use_ci: Flag that determines whether to use Cloud CI/CD.
+        setup_model_monitoring: Whether a Vertex AI Model Monitoring Job is set up.
+
+    Returns:
+        Dict[str, List[str]]: The key output files, keyed by builder name.
+    """
+    outputs = {}
+    if orchestration_framework == Orchestrator.KFP.value:
+        outputs['kfp'] = [
+            f'{BASE_DIR}README.md',
+            GENERATED_PIPELINE_FILE,
+            GENERATED_PIPELINE_RUNNER_FILE,
+            GENERATED_RUN_ALL_SH_FILE]
+        for name in _get_pipeline_component_names():
+            outputs['kfp'] += [
+                f'{BASE_DIR}components/{name}/component.yaml',
+                f'{GENERATED_COMPONENT_BASE_SRC}/{name}.py']
+        if use_ci:
+            outputs['kfp'].append(f'{BASE_DIR}services/submission_service/main.py')
+        if setup_model_monitoring:
+            outputs['kfp'].append(GENERATED_MODEL_MONITORING_MONITOR_PY_FILE)
+    if provisioning_framework == Provisioner.GCLOUD.value:
+        outputs['gcloud'] = [GENERATED_RESOURCES_SH_FILE]
+    elif provisioning_framework == Provisioner.TERRAFORM.value:
+        outputs['terraform'] = [
+            GENERATED_RESOURCES_SH_FILE,
+            f'{BASE_DIR}provision/environment/main.tf',
+            f'{BASE_DIR}provision/state_bucket/main.tf']
+    if deployment_framework == Deployer.CLOUDBUILD.value:
+        outputs['cloudbuild'] = [GENERATED_CLOUDBUILD_FILE]
+    elif deployment_framework == Deployer.GITHUB_ACTIONS.value:
+        outputs['github_actions'] = [GENERATED_GITHUB_ACTIONS_FILE]
+    return outputs
+
+
+def _get_generation_state(generate_digest: str) -> str:
+    """Combines the digest of the generate() inputs with the digest of the defaults file, so that
+    a defaults file changed since the last run (e.g. by monitor()) is not mistaken for current.
+
+    Args:
+        generate_digest: The digest of the generate() inputs, see _get_generate_digest().
+
+    Returns:
+        str: The contents of GENERATED_DIGEST_FILE for the current state.
+    """
+    return f'{generate_digest}\n{_get_file_digest(GENERATED_DEFAULTS_FILE)}'
+
+
+def _is_generation_current(generate_digest: str, generated_outputs: Dict[str, List[str]]) -> bool:
+    """Checks whether the last generate() run had the same inputs, and whether its output, including
+    an unmodified defaults file, is still in place.
+
+    Args:
+        generate_digest: The digest of the generate() inputs, see _get_generate_digest().
+        generated_outputs: The key output files of each builder, see _get_generated_outputs().
+
+    Returns:
+        bool: True if the existing output can be kept as is.
+    """
+    if not os.path.isfile(GENERATED_DEFAULTS_FILE):
+        return False
+    if not all(os.path.isfile(path) for paths in generated_outputs.values() for path in paths):
+        return False
+    try:
+        previous_state = read_file(GENERATED_DIGEST_FILE)
+    except FileNotFoundError:
+        return False
+    return previous_state == _get_generation_state(generate_digest)
+
+
+def _get_credentials_key_input(provision_credentials_key: Optional[str]) -> list:
+    """Describes the provision_credentials_key argument for the digests of generate() and its
+    builders. The argument is usually a path, so the contents of the file it points to are hashed
+    as well; rotating the key then counts as a change even though the path stays the same.
+
+    Args:
+        provision_credentials_key: Either a path to or the contents of a service account key file
+            in JSON format.
+
+    Returns:
+        list: The argument, followed by the digest of the file it names (None if it is not a file).
+    """
+    if provision_credentials_key is not None and os.path.isfile(provision_credentials_key):
+        return [provision_credentials_key, _get_file_digest(provision_credentials_key)]
+    return [provision_credentials_key, None]
+
+
+def _skip_if_unchanged(name: str,
+                       inputs: list,
+                       build: Callable,
+                       generated_outputs: Dict[str, List[str]],
+                       defaults: dict,
+                       package_digest: str,
+                       force: bool) -> Callable:
+    """Wraps a builder so that it only runs if its inputs changed since its last successful run,
+    or if any of its key output files is missing. The builders read the whole defaults file, so all
+    of it is treated as an input of each one.
+
+    Args:
+        name: Name of the builder, used for its stamp file under GENERATED_STAMPS_DIR.
+        inputs: The arguments the builder depends on besides the defaults.
+        build: Function that writes the builder's files.
+        generated_outputs: The key output files of each builder, see _get_generated_outputs().
+        defaults: Contents of the defaults file.
+        package_digest: The digest of the AutoMLOps package, see _get_package_digest().
+        force: If True, runs the builder regardless of its stamp.
+
+    Returns:
+        Callable: Function that runs the builder if needed and updates its stamp.
+    """
+    stamp_file = f'{GENERATED_STAMPS_DIR}/{name}'
+    stamp = hashlib.sha256(
+        json.dumps([defaults, inputs, package_digest], sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+    def run():
+        if not force and all(os.path.isfile(path) for path in generated_outputs.get(name, [])):
+            try:
+                if read_file(stamp_file) == stamp:
+                    logging.info('Inputs of the %s builder unchanged, skipping it.', name)
+                    return
+            except FileNotFoundError:
+                pass
+        build()
+        write_file(stamp_file, stamp, 'w')
+    return run
+
+
+def _derive_resource_names(naming_prefix: str, project_id: str, **overrides) -> _DerivedNames:
+    """Fills in the resource names that were not given explicitly, using _DERIVED_NAME_TEMPLATES.
+
+    Args:
+        naming_prefix: Unique value used to differentiate pipelines and services across AutoMLOps runs.
+        project_id: The project ID.
+        overrides: The user-specified resource names; None values are replaced by the default.
+
+    Returns:
+        _DerivedNames: The resolved resource names.
+    """
+    return _DerivedNames(**{
+        field: overrides[field] if overrides.get(field) is not None
+        else template.format(naming_prefix=naming_prefix, project_id=project_id)
+        for field, template in _DERIVED_NAME_TEMPLATES.items()})
+
 
+def _build_kfp(pipeline_params: dict,
+               custom_training_job_specs: Optional[List[dict]],
+               use_ci: bool,
+               defaults: dict):
+    """Writes the Kubeflow pipeline, component, and (optionally) service code.
 
-def provision(hide_warnings: Optional[bool] = True):
+    Args:
+        pipeline_params: Dictionary containing runtime pipeline parameters.
+        custom_training_job_specs: Stringified custom training job specs, see stringify_job_spec_list.
+        use_ci: Flag that determines whether to write the submission service code.
+        defaults: Contents of the defaults file, shared by all the builders.
+    """
+    from google_cloud_automlops.orchestration.kfp import KFPComponent, KFPPipeline, KFPServices
+
+    # Write kubeflow pipeline code
+    logging.info('Writing kubeflow pipelines code to %spipelines', BASE_DIR)
+    kfppipe = KFPPipeline(func=pipeline_glob.func,
+                          name=pipeline_glob.name,
+                          description=pipeline_glob.description,
+                          comps_dict=components_dict)
+    kfppipe.build(pipeline_params, custom_training_job_specs, defaults)
+
+    # Write kubeflow components code
+    logging.info('Writing kubeflow components code to %scomponents', BASE_DIR)
+    for comp in kfppipe.comps:
+        logging.info('     -- Writing %s', comp.name)
+        KFPComponent(func=comp.func, packages_to_install=comp.packages_to_install).build(defaults)
+
+    # If user specified services, write services scripts
+    if use_ci:
+        logging.info('Writing submission service code to %sservices', BASE_DIR)
+        KFPServices().build(defaults)
+
+@functools.lru_cache(maxsize=8)
+def _load_defaults_cached(path: str, digest: str) -> dict:
+    """Loads the defaults file once per (path, content digest) combination. The json sidecar
+    written next to it is used instead of parsing the yaml when it records the same digest; if it
+    is stale, missing, or unreadable, the yaml is parsed and the sidecar rewritten. Keying on the
+    contents rather than the mtime means edits made within the filesystem's mtime resolution are
+    never missed.
+
+    Args:
+        path: Absolute path to the defaults file.
+        digest: sha256 of the defaults file contents, used as part of the cache key.
+
+    Returns:
+        dict: Contents of the defaults file.
+    """
+    try:
+        with open(path + '.json', 'r', encoding='utf-8') as file:
+            sidecar = json.load(file)
+        if sidecar['digest'] == digest:
+            return sidecar['defaults']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    defaults = read_yaml_file(path)
+    _write_defaults_sidecar(path, defaults, digest)
+    return defaults
+
+
+def _write_defaults_sidecar(path: str, defaults: dict, digest: str):
+    """Writes the json sidecar of the defaults file. Failures are ignored, since readers fall
+    back to the yaml whenever the sidecar is missing, stale, or unreadable.
+
+    Args:
+        path: Absolute path to the defaults file.
+        defaults: Contents of the defaults file.
+        digest: sha256 of the defaults file contents the sidecar was built from.
+    """
+    try:
+        write_file(path + '.json', json.dumps({'digest': digest, 'defaults': defaults}), 'w')
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _read_defaults() -> dict:
+    """Reads the generated defaults file, reusing the previous parse if the file is unchanged.
+    A deep copy is returned so callers are free to modify the result.
+
+    Returns:
+        dict: Contents of config/defaults.yaml.
+    """
+    path = os.path.abspath(GENERATED_DEFAULTS_FILE)
+    with open(path, 'rb') as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    return copy.deepcopy(_load_defaults_cached(path, digest))
+
+
+def _write_defaults(defaults: dict):
+    """Writes config/defaults.yaml along with its json sidecar. If the file already holds the
+    same text it is left untouched, so its mtime (and everything cached against it) is kept.
+
+    Args:
+        defaults: The configuration to write.
+    """
+    text = DEFAULTS_HEADER + dump_yaml(defaults)
+    if write_file_if_changed(GENERATED_DEFAULTS_FILE, text):
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        _write_defaults_sidecar(os.path.abspath(GENERATED_DEFAULTS_FILE), defaults, digest)
+
+
+def provision(hide_warnings: Optional[bool] = True, defaults: Optional[dict] = None):
     """Provisions the necessary infra to run MLOps pipelines. The provisioning option (e.g.
     terraform, gcloud, etc.) is set during the generate() step and stored in config/defaults.yaml. 
 
     Args:
         hide_warnings: Boolean that specifies whether to show permissions warnings before provisioning.
+        defaults: The configuration returned by generate(). Read from config/defaults.yaml if not given.
     """
-    defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+    if defaults is None:
+        defaults = _read_defaults()
     provisioning_framework = defaults['tooling']['provisioning_framework']
 
     if not hide_warnings:
@@ -427,10 +825,10 @@ def provision(hide_warnings: Optional[bool] = True):
         account_permissions_warning(operation='provision', defaults=defaults)
 
     if provisioning_framework == Provisioner.GCLOUD.value:
-        execute_process(f'./{GENERATED_RESOURCES_SH_FILE}', to_null=False)
+        execute_process([f'./{GENERATED_RESOURCES_SH_FILE}'], to_null=False)
     elif provisioning_framework == Provisioner.TERRAFORM.value:
-        execute_process(f'./{GENERATED_RESOURCES_SH_FILE} state_bucket', to_null=False)
-        execute_process(f'./{GENERATED_RESOURCES_SH_FILE} environment', to_null=False)
+        execute_process([f'./{GENERATED_RESOURCES_SH_FILE}', 'state_bucket'], to_null=False)
+        execute_process([f'./{GENERATED_RESOURCES_SH_FILE}', 'environment'], to_null=False)
 
 
 def deprovision():
@@ -438,18 +836,19 @@ def deprovision():
     works with terraform. The provisioning option (e.g. terraform, gcloud, etc.) is set during the
     generate() step and stored in config/defaults.yaml. 
     """
-    defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+    defaults = _read_defaults()
     provisioning_framework = defaults['tooling']['provisioning_framework']
 
     if provisioning_framework == Provisioner.GCLOUD.value:
         raise ValueError('De-provisioning is currently only supported for provisioning_framework={terraform, pulumi}.')
 
-    execute_process(f'terraform -chdir={BASE_DIR}provision/environment destroy -auto-approve', to_null=False)
+    execute_process(['terraform', f'-chdir={BASE_DIR}provision/environment', 'destroy', '-auto-approve'], to_null=False)
 
 
 def deploy(
     hide_warnings: Optional[bool] = True,
-    precheck: Optional[bool] = False):
+    precheck: Optional[bool] = False,
+    defaults: Optional[dict] = None):
     """Builds and pushes the component_base image, compiles the pipeline, and submits a message to
     the queueing service to execute a PipelineJob. The specifics of the deploy step are dependent on
     the defaults set during the generate() step, particularly:
@@ -464,8 +863,10 @@ def deploy(
     Args:
         hide_warnings: Boolean that specifies whether to show permissions warnings before deploying.
         precheck: Boolean that specifies whether to check if the infra exists before deploying.
+        defaults: The configuration returned by generate(). Read from config/defaults.yaml if not given.
     """
-    defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+    if defaults is None:
+        defaults = _read_defaults()
     use_ci = defaults['tooling']['use_ci']
 
     if precheck:
@@ -480,13 +881,11 @@ def deploy(
     if use_ci:
         git_workflow()
     else:
-        os.chdir(BASE_DIR)
         try:
-            subprocess.run(['./scripts/run_all.sh'], shell=True,
+            subprocess.run(['./scripts/run_all.sh'], cwd=BASE_DIR,
                            check=True, stderr=subprocess.STDOUT)
         except subprocess.CalledProcessError as e:
-            logging.info(e) # graceful error exit to allow for cd-ing back
-        os.chdir('../')
+            logging.info(e)
 
     # Log generated resources
     resources_generation_manifest(defaults)
@@ -541,7 +940,7 @@ def monitor(
     elif skew_thresholds and not training_dataset:
         raise ValueError('training_dataset must be set to use skew_thresolds.')
 
-    defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+    defaults = _read_defaults()
     if not defaults['gcp']['setup_model_monitoring']:
         raise ValueError('Parameter setup_model_monitoring in .generate() must be set to True to use .monitor()')
     if not hide_warnings:
@@ -563,16 +962,38 @@ def monitor(
     defaults['monitoring']['skew_thresholds'] = skew_thresholds
     defaults['monitoring']['training_dataset'] = training_dataset
 
-    write_file(GENERATED_DEFAULTS_FILE, DEFAULTS_HEADER, 'w')
-    write_yaml_file(GENERATED_DEFAULTS_FILE, defaults, 'a')
+    _write_defaults(defaults)
 
-    os.chdir(BASE_DIR)
     try:
-        subprocess.run(['./scripts/create_model_monitoring_job.sh'], shell=True,
-                        check=True, stderr=subprocess.STDOUT)
+        subprocess.run(['./scripts/create_model_monitoring_job.sh'], cwd=BASE_DIR,
+                       check=True, stderr=subprocess.STDOUT)
     except subprocess.CalledProcessError as e:
-        logging.info(e) # graceful error exit to allow for cd-ing back
-    os.chdir('../')
+        logging.info(e)
+
+
+def _get_scaffold_key(func: Callable, kind: str, **decorator_args) -> Optional[tuple]:
+    """Builds the _scaffold_cache key for a decorated function from its source, its signature
+    defaults and annotations (which can change without the source changing, e.g. when they refer
+    to a rebound global), and the decorator arguments.
+
+    Args:
+        func: The decorated python function.
+        kind: The decorator used, either 'component' or 'pipeline'.
+        decorator_args: The decorator arguments that affect the created object; values must be
+            hashable.
+
+    Returns:
+        Optional[tuple]: The cache key, or None if func is not a function with retrievable source.
+    """
+    if not inspect.isfunction(func):
+        return None
+    try:
+        source = inspect.getsource(func)
+    except OSError:
+        return None
+    return (kind, func.__module__, func.__qualname__, source,
+            repr(func.__defaults__), repr(func.__kwdefaults__), repr(func.__annotations__),
+            tuple(sorted(decorator_args.items())))
 
 
 def component(func: Optional[Callable] = None,
@@ -598,10 +1019,17 @@ def component(func: Optional[Callable] = None,
             component,
             packages_to_install=packages_to_install)
     else:
-        components_dict[func.__name__] = BaseComponent(
-            func=func,
-            packages_to_install=packages_to_install
-        )
+        key = _get_scaffold_key(func, 'component',
+                                packages_to_install=tuple(packages_to_install or ()))
+        comp = _scaffold_cache.get(key)
+        if comp is None:
+            comp = BaseComponent(
+                func=func,
+                packages_to_install=packages_to_install
+            )
+            if key is not None:
+                _scaffold_cache[key] = comp
+        components_dict[func.__name__] = comp
         return
 
 
@@ -639,8 +1067,16 @@ def pipeline(func: Optional[Callable] = None,
             description=description)
     else:
         global pipeline_glob
-        pipeline_glob = BasePipeline(func=func,
-                                 name=name,
-                                 description=description,
-                                 comps_dict=components_dict)
+        key = _get_scaffold_key(func, 'pipeline',
+                                name=name,
+                                description=description,
+                                comps=tuple((comp_name, id(comp)) for comp_name, comp in components_dict.items()))
+        pipeline_glob = _scaffold_cache.get(key)
+        if pipeline_glob is None:
+            pipeline_glob = BasePipeline(func=func,
+                                         name=name,
+                                         description=description,
+                                         comps_dict=components_dict)
+            if key is not None:
+                _scaffold_cache[key] = pipeline_glob
         return
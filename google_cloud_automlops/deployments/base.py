@@ -18,6 +18,8 @@
 # pylint: disable=C0103
 # pylint: disable=line-too-long
 
+from typing import Optional
+
 from google_cloud_automlops.utils.constants import GENERATED_DEFAULTS_FILE
 
 from google_cloud_automlops.utils.utils import read_yaml_file
@@ -27,10 +29,15 @@ class Deployment():
     """The Deployment object represents all information and functions to create an AutoMLOps
     system's deployment.
     """
-    def __init__(self):
+    def __init__(self, defaults: Optional[dict] = None):
         """Initializes a generic Deployment object by reading in default attributes.
+
+        Args:
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
         """
-        defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+        if defaults is None:
+            defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
         self.use_ci = defaults['tooling']['use_ci']
         self.artifact_repo_location = defaults['gcp']['artifact_repo_location']
         self.artifact_repo_name = defaults['gcp']['artifact_repo_name']
@@ -24,6 +24,8 @@ except ImportError:
     # Try backported to PY<37 `importlib_resources`
     from importlib_resources import files as import_files
 
+from typing import Optional
+
 from google_cloud_automlops.utils.utils import (
     render_jinja,
     write_file
@@ -48,7 +50,8 @@ class GitHubActions(Deployment):
                  project_number: str,
                  workload_identity_pool: str,
                  workload_identity_provider: str,
-                 workload_identity_service_account: str):
+                 workload_identity_service_account: str,
+                 defaults: Optional[dict] = None):
         """Initializes a GitHub Actions object by reading in default attributes.
 
         Args:
@@ -56,8 +59,10 @@ class GitHubActions(Deployment):
             workload_identity_pool (str): Pool for workload identity federation.
             workload_identity_provider (str): Provider for workload identity federation.
             workload_identity_service_account (str): Service account for workload identity federation (specify the full string).
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
         """
-        super().__init__()
+        super().__init__(defaults)
         self.project_number = project_number
         self.workload_identity_pool = workload_identity_pool
         self.workload_identity_provider = workload_identity_provider
@@ -83,15 +83,20 @@ class BaseComponent():
         self.project_id = None
         self.naming_prefix = None
 
-    def build(self):
+    def build(self, defaults: Optional[dict] = None):
         """Instantiates an abstract built method to create and write task files. Also reads in
         defaults file to save default arguments to attributes.
 
+        Args:
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
+
         Raises:
             NotImplementedError: The subclass has not defined the `build` method.
         """
 
-        defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+        if defaults is None:
+            defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
         self.artifact_repo_location = defaults['gcp']['artifact_repo_location']
         self.artifact_repo_name = defaults['gcp']['artifact_repo_name']
         self.project_id = defaults['gcp']['project_id']
@@ -227,7 +232,8 @@ class BasePipeline():
 
     def build(self,
               pipeline_params: dict,
-              custom_training_job_specs: Optional[List] = None):
+              custom_training_job_specs: Optional[List] = None,
+              defaults: Optional[dict] = None):
         """Instantiates an abstract built method to create and write pipeline files. Also reads in
         defaults file to save default arguments to attributes.
 
@@ -240,6 +246,8 @@ class BasePipeline():
             custom_training_job_specs (dict): Specifies the specs to run the training job with.
             pipeline_params (Optional[List]): Dictionary containing runtime pipeline parameters.
                 Defaults to None.
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
 
         Raises:
             NotImplementedError: The subclass has not defined the `build` method.
@@ -249,7 +257,8 @@ class BasePipeline():
         self.pipeline_params = pipeline_params
 
         # Extract additional attributes from defaults file
-        defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+        if defaults is None:
+            defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
         self.project_id = defaults['gcp']['project_id']
         self.gs_pipeline_job_spec_path = defaults['pipelines']['gs_pipeline_job_spec_path']
         self.base_image = defaults['gcp']['base_image']
@@ -307,11 +316,12 @@ class BaseServices():
         self.project_id = None
         self.pipeline_job_submission_service_type = None
         self.setup_model_monitoring = None
+        self.enable_caching = None
 
         # Set directory for files to be written to
         self.submission_service_base_dir = BASE_DIR + 'services/submission_service'
 
-    def build(self):
+    def build(self, defaults: Optional[dict] = None):
         """Constructs and writes files related to submission services and model monitoring. 
         
             Files created under AutoMLOps/:
@@ -323,15 +333,21 @@ class BaseServices():
                 model_monitoring/ (if requested)
                     monitor.py
                     requirements.txt
+
+        Args:
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
         """
         # Extract additional attributes from defaults file
-        defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+        if defaults is None:
+            defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
         self.pipeline_storage_path = defaults['pipelines']['pipeline_storage_path']
         self.pipeline_job_location = defaults['gcp']['pipeline_job_location']
         self.pipeline_job_runner_service_account = defaults['gcp']['pipeline_job_runner_service_account']
         self.pipeline_job_submission_service_type = defaults['gcp']['pipeline_job_submission_service_type']
         self.project_id = defaults['gcp']['project_id']
         self.setup_model_monitoring = defaults['gcp']['setup_model_monitoring']
+        self.enable_caching = defaults['pipelines'].get('enable_caching', True)
 
         # Set directory for files to be written to
         self.submission_service_base_dir = BASE_DIR + 'services/submission_service'
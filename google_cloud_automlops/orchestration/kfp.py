@@ -18,8 +18,10 @@
 # pylint: disable=C0103
 # pylint: disable=line-too-long
 
+import ast
 import json
 import textwrap
+import typing
 from typing import Callable, List, Optional
 
 try:
@@ -29,7 +31,7 @@ except ImportError:
     from importlib_resources import files as import_files
 
 from kfp.dsl import component
-from kfp import compiler
+from kfp import compiler, dsl
 
 from google_cloud_automlops.orchestration.base import BaseComponent, BasePipeline, BaseServices
 from google_cloud_automlops.utils.utils import (
@@ -71,10 +73,15 @@ class KFPComponent(BaseComponent):
         BaseComponent (object): Generic Component object.
     """
 
-    def build(self):
+    def build(self, defaults: Optional[dict] = None):
         """Constructs files for running and managing Kubeflow pipelines.
+
+        Args:
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
         """
-        defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+        if defaults is None:
+            defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
         self.artifact_repo_location = defaults['gcp']['artifact_repo_location']
         self.artifact_repo_name = defaults['gcp']['artifact_repo_name']
         self.project_id = defaults['gcp']['project_id']
@@ -117,14 +124,11 @@ class KFPComponent(BaseComponent):
             f'''/pipelines/component/src/{self.name + '.py'}''']
 
         # Write license and overwrite component spec to the appropriate component.yaml file
-        write_file(
-            filepath=comp_yaml_path,
-            text=GENERATED_LICENSE,
-            mode='w')
         write_yaml_file(
             filepath=comp_yaml_path,
             contents=component_spec,
-            mode='a')
+            mode='w',
+            header=GENERATED_LICENSE)
 
 
 class KFPPipeline(BasePipeline):
@@ -165,7 +169,8 @@ class KFPPipeline(BasePipeline):
 
     def build(self,
               pipeline_params: dict,
-              custom_training_job_specs: Optional[List] = None):
+              custom_training_job_specs: Optional[List] = None,
+              defaults: Optional[dict] = None):
         """Constructs files for running and managing Kubeflow pipelines.
 
             Files created under AutoMLOps/:
@@ -190,14 +195,17 @@ class KFPPipeline(BasePipeline):
             custom_training_job_specs (dict): Specifies the specs to run the training job with.
             pipeline_params (Optional[List]): Dictionary containing runtime pipeline parameters. Defaults
                 to None.
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
 
         """
         # Save parameters as attributes
         self.custom_training_job_specs = custom_training_job_specs
-        self.pipeline_params = pipeline_params
+        self.pipeline_params = dict(pipeline_params)
 
         # Extract additional attributes from defaults file
-        defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+        if defaults is None:
+            defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
         self.project_id = defaults['gcp']['project_id']
         self.gs_pipeline_job_spec_path = defaults['pipelines']['gs_pipeline_job_spec_path']
         self.base_image = defaults['gcp']['base_image']
@@ -291,15 +299,18 @@ class KFPPipeline(BasePipeline):
         # pipelines/pipeline.py: Generates a Kubeflow pipeline spec from custom components.
         components_list = self._get_component_list()
         pipeline_scaffold_contents = textwrap.indent(self.pipeline_scaffold, 4 * ' ')
+        dsl_imports, typing_imports = self._get_pipeline_imports(components_list)
         write_file(
             filepath=GENERATED_PIPELINE_FILE,
             text=render_jinja(
                 template_path=import_files(KFP_TEMPLATES_PATH + '.pipelines') / 'pipeline.py.j2',
                 components_list=components_list,
                 custom_training_job_specs=self.custom_training_job_specs,
+                dsl_imports=dsl_imports,
                 generated_license=GENERATED_LICENSE,
                 pipeline_scaffold_contents=pipeline_scaffold_contents,
-                project_id=self.project_id),
+                project_id=self.project_id,
+                typing_imports=typing_imports),
             mode='w')
 
         # pipelines/pipeline_runner.py: Sends a PipelineJob to Vertex AI using pipeline spec.
@@ -348,6 +359,33 @@ class KFPPipeline(BasePipeline):
             f'\n'
         )
 
+    def _get_pipeline_imports(self, components_list: List[str]) -> tuple:
+        """Finds the kfp.dsl and typing names the pipeline scaffold refers to, so that the
+        generated pipeline.py can import them explicitly instead of using star imports.
+
+        Args:
+            components_list (List[str]): Names of the components loaded in the pipeline.
+
+        Returns:
+            tuple: Sorted lists of the names to import from kfp.dsl and from typing.
+        """
+        try:
+            tree = ast.parse(self.pipeline_scaffold)
+        except SyntaxError:
+            return ['*'], ['*']
+        defined = set(components_list)
+        referenced = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                (referenced if isinstance(node.ctx, ast.Load) else defined).add(node.id)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                defined.add(node.name)
+            elif isinstance(node, ast.arg):
+                defined.add(node.arg)
+        referenced -= defined | {'compiler', 'dsl'}
+        dsl_names = {name for name in dir(dsl) if not name.startswith('_')}
+        return sorted(referenced & dsl_names), sorted(referenced & set(typing.__all__))
+
     def _get_component_list(self) -> str:
         """Gets a list of all the component names in a pipeline.
 
@@ -414,7 +452,7 @@ class KFPPipeline(BasePipeline):
             set_of_requirements = set(user_inp_reqs)
         else:
             # If user did not input requirements, then infer reqs using pipreqs
-            execute_process(f'python3 -m pipreqs.pipreqs {GENERATED_COMPONENT_BASE} --mode no-pin --force', to_null=True)
+            execute_process(['python3', '-m', 'pipreqs.pipreqs', GENERATED_COMPONENT_BASE, '--mode', 'no-pin', '--force'], to_null=True)
             pipreqs = read_file(reqs_filename).splitlines()
             set_of_requirements = set(pipreqs + default_gcp_reqs)
 
@@ -496,7 +534,8 @@ class KFPServices(BaseServices):
                 pipeline_job_runner_service_account=self.pipeline_job_runner_service_account,
                 pipeline_job_submission_service_type=self.pipeline_job_submission_service_type,
                 project_id=self.project_id,
-                setup_model_monitoring=self.setup_model_monitoring),
+                setup_model_monitoring=self.setup_model_monitoring,
+                enable_caching=self.enable_caching),
             'w')
 
         write_file(
@@ -18,6 +18,8 @@
 # pylint: disable=C0103
 # pylint: disable=line-too-long
 
+from typing import Optional
+
 from google_cloud_automlops.utils.constants import (
     DEFAULT_SCHEDULE_PATTERN,
     GENERATED_DEFAULTS_FILE
@@ -38,14 +40,17 @@ class Infrastructure():
     """The Infrastructure object represents all information and functions to create an AutoMLOps
     system's infrastructure.
     """
-    def __init__(self, provision_credentials_key):
+    def __init__(self, provision_credentials_key, defaults: Optional[dict] = None):
         """Initializes a generic Infrastructure object by reading in default attributes.
 
         Args:
             provision_credentials_key (str): Either a path to or the contents of a service account
                 key file in JSON format.
+            defaults (Optional[dict]): Contents of the defaults file. Read from
+                config/defaults.yaml if not given.
         """
-        defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
+        if defaults is None:
+            defaults = read_yaml_file(GENERATED_DEFAULTS_FILE)
         self.use_ci = defaults['tooling']['use_ci']
         self.artifact_repo_location = defaults['gcp']['artifact_repo_location']
         self.artifact_repo_name = defaults['gcp']['artifact_repo_name']
@@ -61,6 +61,8 @@ MIN_RECOMMENDED_TERRAFORM_VERSION = '1.5.6'
 # AutoMLOps file paths
 BASE_DIR = 'AutoMLOps/'
 GENERATED_DEFAULTS_FILE = BASE_DIR + 'configs/defaults.yaml'
+GENERATED_DIGEST_FILE = BASE_DIR + '.automlops_gen_hash'
+GENERATED_STAMPS_DIR = BASE_DIR + '.automlops_stamps'
 GENERATED_PIPELINE_SPEC_SH_FILE = BASE_DIR + 'scripts/build_pipeline_spec.sh'
 GENERATED_BUILD_COMPONENTS_SH_FILE = BASE_DIR + 'scripts/build_components.sh'
 GENERATED_RUN_PIPELINE_SH_FILE = BASE_DIR + 'scripts/run_pipeline.sh'
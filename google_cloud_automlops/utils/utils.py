@@ -26,6 +26,7 @@ except ImportError:
     # Try backported to PY<37 `importlib_resources`
     from importlib_resources import files as import_files
 
+import functools
 import inspect
 import itertools
 import json
@@ -33,7 +34,7 @@ import logging
 import os
 import subprocess
 import textwrap
-from typing import Callable
+from typing import Callable, List, Optional, Union
 
 from packaging import version
 import yaml
@@ -67,22 +68,38 @@ from google_cloud_automlops.utils.enums import (
     Provisioner
 )
 
+# Use the libyaml based loader and dumper when available; they match SafeLoader and SafeDumper
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 def make_dirs(directories: list):
-    """Makes directories with the specified names.
+    """Makes directories with the specified names. Duplicates are dropped and parents are
+    made before their children; each parent directory is listed at most once, and only the
+    entries missing from it are created.
 
     Args:
         directories (list): Path of the directories to make.
     """
-    for d in directories:
-        try:
-            os.makedirs(d)
-        except FileExistsError:
-            pass
+    existing = {}
+    for d in sorted(set(directories), key=len):
+        parent, name = os.path.split(os.path.normpath(d))
+        parent = parent or '.'
+        if parent not in existing:
+            try:
+                with os.scandir(parent) as entries:
+                    existing[parent] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                existing[parent] = set()
+        if name in existing[parent]:
+            continue
+        os.makedirs(d, exist_ok=True)
+        existing[parent].add(name)
 
 
 def read_yaml_file(filepath: str) -> dict:
-    """Reads a yaml and returns file contents as a dict. Defaults to utf-8 encoding.
+    """Reads a yaml and returns file contents as a dict. Defaults to utf-8 encoding. Uses the
+    libyaml parser when PyYAML was built with it.
 
     Args:
         filepath (str): Path to the yaml.
@@ -95,30 +112,49 @@ def read_yaml_file(filepath: str) -> dict:
     """
     try:
         with open(filepath, 'r', encoding='utf-8') as file:
-            file_dict = yaml.safe_load(file)
+            file_dict = yaml.load(file, Loader=_YAML_LOADER)
         file.close()
     except yaml.YAMLError as err:
         raise yaml.YAMLError(f'Error reading file. {err}') from err
     return file_dict
 
 
-def write_yaml_file(filepath: str, contents: dict, mode: str):
-    """Writes a dictionary to yaml. Defaults to utf-8 encoding.
+def dump_yaml(contents: dict) -> str:
+    """Serializes a dictionary to a yaml string, the same way write_yaml_file does. Uses the
+    libyaml emitter when PyYAML was built with it.
+
+    Args:
+        contents (dict): Dictionary to be serialized.
+
+    Returns:
+        str: The yaml text.
+
+    Raises:
+        Exception: An error is encountered while serializing the dictionary.
+    """
+    try:
+        return yaml.dump(contents, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+    except yaml.YAMLError as err:
+        raise yaml.YAMLError(f'Error writing to file. {err}') from err
+
+
+def write_yaml_file(filepath: str, contents: dict, mode: str, header: str = ''):
+    """Writes a dictionary to yaml. Defaults to utf-8 encoding. Uses the libyaml
+    emitter when PyYAML was built with it.
 
     Args:
         filepath (str): Path to the file.
         contents (dict): Dictionary to be written to yaml.
         mode (str): Read/write mode to be used.
+        header (str): Text written before the yaml, in the same open() call.
 
     Raises:
         Exception: An error is encountered while writing the file.
     """
-    try:
-        with open(filepath, mode, encoding='utf-8') as file:
-            yaml.safe_dump(contents, file, sort_keys=False)
-        file.close()
-    except yaml.YAMLError as err:
-        raise yaml.YAMLError(f'Error writing to file. {err}') from err
+    text = header + dump_yaml(contents)
+    with open(filepath, mode, encoding='utf-8') as file:
+        file.write(text)
+    file.close()
 
 
 def read_file(filepath: str) -> str:
@@ -161,6 +197,37 @@ def write_file(filepath: str, text: str, mode: str):
         raise OSError(f'Error writing to file. {err}') from err
 
 
+def write_file_if_changed(filepath: str, text: str) -> bool:
+    """Writes a file at the specified path unless it already holds exactly the given text, so
+    that its mtime is left alone. The new contents are written to a temporary file that then
+    replaces the target, so readers never see a partially written file. Defaults to utf-8
+    encoding.
+
+    Args:
+        filepath (str): Path to the file.
+        text (str): Text to be written to file.
+
+    Returns:
+        bool: Whether the file was written.
+
+    Raises:
+        Exception: An error is encountered writing the file.
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8') as file:
+            if file.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    tmp_filepath = filepath + '.tmp'
+    write_file(tmp_filepath, text, 'w')
+    try:
+        os.replace(tmp_filepath, filepath)
+    except OSError as err:
+        raise OSError(f'Error writing to file. {err}') from err
+    return True
+
+
 def write_and_chmod(filepath: str, text: str):
     """Writes a file at the specified path and chmods the file to allow for execution.
 
@@ -205,24 +272,28 @@ def is_component_config(filepath: str) -> bool:
     return all(key in file_dict.keys() for key in required_keys)
 
 
-def execute_process(command: str, to_null: bool):
-    """Executes an external shell process.
+def execute_process(command: Union[str, List[str]], to_null: bool, cwd: Optional[str] = None):
+    """Executes an external process. Argument lists are executed directly, without
+    spawning a shell; plain strings are still passed through the shell.
 
     Args:
-        command (str): Command to execute.
+        command (Union[str, List[str]]): Command to execute, as a shell string or argv list.
         to_null (bool): Determines where to send output.
+        cwd (Optional[str]): Directory to execute the command in. Defaults to the current directory.
 
     Raises:
         Exception: An error occured while executing the script.
     """
     stdout = subprocess.DEVNULL if to_null else None
+    shell = isinstance(command, str)
     try:
-        subprocess.run([command],
-                       shell=True,
+        subprocess.run([command] if shell else command,
+                       shell=shell,
                        check=True,
+                       cwd=cwd,
                        stdout=stdout,
                        stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as err:
+    except (subprocess.CalledProcessError, OSError) as err:
         raise RuntimeError(f'Error executing process. {err}') from err
 
 
@@ -285,6 +356,8 @@ def get_function_source_definition(func: Callable) -> str:
 
 def stringify_job_spec_list(job_spec_list: list) -> list:
     """Takes in a list of job spec dictionaries and turns them into strings.
+    Results are memoized on the json serialization of the input, so repeated
+    generate() calls with the same specs do not redo the formatting.
 
     Args:
         job_spec (list): Dictionary with job spec info. e.g.
@@ -301,18 +374,32 @@ def stringify_job_spec_list(job_spec_list: list) -> list:
     """
     if not job_spec_list:
         return None
-    output = []
     for spec in job_spec_list:
-        mapping = {}
-        if isinstance(spec['component_spec'], str):
-            mapping['component_spec'] = spec['component_spec']
-        else:
+        if not isinstance(spec['component_spec'], str):
             raise ValueError('component_spec must be a string.')
+    output = _stringify_job_spec_list_cached(json.dumps(job_spec_list, sort_keys=True))
+    return [dict(mapping) for mapping in output]
+
+
+@functools.lru_cache(maxsize=32)
+def _stringify_job_spec_list_cached(job_spec_list_json: str) -> tuple:
+    """Formats a json serialized list of job specs; see stringify_job_spec_list.
+
+    Args:
+        job_spec_list_json (str): The job spec list serialized with sorted keys.
+
+    Returns:
+        tuple[dict]: Python formatted dictionary code for each job spec.
+    """
+    output = []
+    for spec in json.loads(job_spec_list_json):
+        mapping = {}
+        mapping['component_spec'] = spec['component_spec']
         # Remove string quotes from component spec line
         mapping['spec_string'] = json.dumps(spec, sort_keys=True, indent=8).replace(f'''"{spec['component_spec']}"''', f'''{spec['component_spec']}''')
         mapping['spec_string'] = mapping['spec_string'].replace('}', '    }') # align closing bracket
         output.append(mapping)
-    return output
+    return tuple(output)
 
 
 def create_default_config(artifact_repo_location: str,
@@ -379,55 +466,69 @@ def create_default_config(artifact_repo_location: str,
         use_ci (bool): Specifies whether to use Cloud CI/CD.
         vpc_connector (str): Name of the vpc connector to use.
 
+    Returns:
+        dict: Defaults yaml file content.
+    """
+    return create_default_config_from_dict(locals())
+
+
+def create_default_config_from_dict(config: dict) -> dict:
+    """Creates defaults.yaml file contents from a dict holding the arguments of
+    create_default_config(), keyed by argument name. Lets callers that already have the
+    values in a dict skip the keyword argument packing.
+
+    Args:
+        config (dict): The create_default_config() arguments, keyed by argument name.
+
     Returns:
         dict: Defaults yaml file content.
     """
     defaults = {}
     defaults['gcp'] = {}
-    defaults['gcp']['artifact_repo_location'] = artifact_repo_location
-    defaults['gcp']['artifact_repo_name'] = artifact_repo_name
-    defaults['gcp']['artifact_repo_type'] = artifact_repo_type
-    defaults['gcp']['base_image'] = base_image
-    if use_ci:
-        defaults['gcp']['build_trigger_location'] = build_trigger_location
-        defaults['gcp']['build_trigger_name'] = build_trigger_name
-    defaults['gcp']['naming_prefix'] = naming_prefix
-    defaults['gcp']['pipeline_job_location'] = pipeline_job_location
-    defaults['gcp']['pipeline_job_runner_service_account'] = pipeline_job_runner_service_account
-    if use_ci:
-        defaults['gcp']['pipeline_job_submission_service_location'] = pipeline_job_submission_service_location
-        defaults['gcp']['pipeline_job_submission_service_name'] = pipeline_job_submission_service_name
-        defaults['gcp']['pipeline_job_submission_service_type'] = pipeline_job_submission_service_type
-    defaults['gcp']['project_id'] = project_id
-    defaults['gcp']['setup_model_monitoring'] = setup_model_monitoring
-    if use_ci:
-        defaults['gcp']['pubsub_topic_name'] = pubsub_topic_name
-        defaults['gcp']['schedule_location'] = schedule_location
-        defaults['gcp']['schedule_name'] = schedule_name
-        defaults['gcp']['schedule_pattern'] = schedule_pattern
-        defaults['gcp']['source_repository_branch'] = source_repo_branch
-        defaults['gcp']['source_repository_name'] = source_repo_name
-        defaults['gcp']['source_repository_type'] = source_repo_type
-    defaults['gcp']['storage_bucket_location'] = storage_bucket_location
-    defaults['gcp']['storage_bucket_name'] = storage_bucket_name
-    if use_ci:
-        defaults['gcp']['vpc_connector'] = vpc_connector
+    defaults['gcp']['artifact_repo_location'] = config['artifact_repo_location']
+    defaults['gcp']['artifact_repo_name'] = config['artifact_repo_name']
+    defaults['gcp']['artifact_repo_type'] = config['artifact_repo_type']
+    defaults['gcp']['base_image'] = config['base_image']
+    if config['use_ci']:
+        defaults['gcp']['build_trigger_location'] = config['build_trigger_location']
+        defaults['gcp']['build_trigger_name'] = config['build_trigger_name']
+    defaults['gcp']['naming_prefix'] = config['naming_prefix']
+    defaults['gcp']['pipeline_job_location'] = config['pipeline_job_location']
+    defaults['gcp']['pipeline_job_runner_service_account'] = config['pipeline_job_runner_service_account']
+    if config['use_ci']:
+        defaults['gcp']['pipeline_job_submission_service_location'] = config['pipeline_job_submission_service_location']
+        defaults['gcp']['pipeline_job_submission_service_name'] = config['pipeline_job_submission_service_name']
+        defaults['gcp']['pipeline_job_submission_service_type'] = config['pipeline_job_submission_service_type']
+    defaults['gcp']['project_id'] = config['project_id']
+    defaults['gcp']['setup_model_monitoring'] = config['setup_model_monitoring']
+    if config['use_ci']:
+        defaults['gcp']['pubsub_topic_name'] = config['pubsub_topic_name']
+        defaults['gcp']['schedule_location'] = config['schedule_location']
+        defaults['gcp']['schedule_name'] = config['schedule_name']
+        defaults['gcp']['schedule_pattern'] = config['schedule_pattern']
+        defaults['gcp']['source_repository_branch'] = config['source_repo_branch']
+        defaults['gcp']['source_repository_name'] = config['source_repo_name']
+        defaults['gcp']['source_repository_type'] = config['source_repo_type']
+    defaults['gcp']['storage_bucket_location'] = config['storage_bucket_location']
+    defaults['gcp']['storage_bucket_name'] = config['storage_bucket_name']
+    if config['use_ci']:
+        defaults['gcp']['vpc_connector'] = config['vpc_connector']
 
     defaults['pipelines'] = {}
-    defaults['pipelines']['gs_pipeline_job_spec_path'] = f'gs://{storage_bucket_name}/pipeline_root/{naming_prefix}/pipeline_job.yaml'
+    defaults['pipelines']['gs_pipeline_job_spec_path'] = f'gs://{config["storage_bucket_name"]}/pipeline_root/{config["naming_prefix"]}/pipeline_job.yaml'
     defaults['pipelines']['parameter_values_path'] = GENERATED_PARAMETER_VALUES_PATH
     defaults['pipelines']['pipeline_component_directory'] = 'components'
     defaults['pipelines']['pipeline_job_spec_path'] = GENERATED_PIPELINE_JOB_SPEC_PATH
-    defaults['pipelines']['pipeline_region'] = storage_bucket_location
-    defaults['pipelines']['pipeline_storage_path'] = f'gs://{storage_bucket_name}/pipeline_root'
+    defaults['pipelines']['pipeline_region'] = config['storage_bucket_location']
+    defaults['pipelines']['pipeline_storage_path'] = f'gs://{config["storage_bucket_name"]}/pipeline_root'
 
     defaults['tooling'] = {}
-    defaults['tooling']['deployment_framework'] = deployment_framework
-    defaults['tooling']['provisioning_framework'] = provisioning_framework
-    defaults['tooling']['orchestration_framework'] = orchestration_framework
-    defaults['tooling']['use_ci'] = use_ci
+    defaults['tooling']['deployment_framework'] = config['deployment_framework']
+    defaults['tooling']['provisioning_framework'] = config['provisioning_framework']
+    defaults['tooling']['orchestration_framework'] = config['orchestration_framework']
+    defaults['tooling']['use_ci'] = config['use_ci']
 
-    if setup_model_monitoring:
+    if config['setup_model_monitoring']:
         # These fields will be set up if and when AutoMLOps.monitor() is called
         defaults['monitoring'] = {}
         defaults['monitoring']['target_field'] = None
@@ -510,7 +611,7 @@ def get_provision_min_permissions(defaults: dict) -> list:
         if defaults['tooling']['deployment_framework'] == Deployer.CLOUDBUILD.value:
             required_permissions.extend(['cloudbuild.builds.list', 'cloudbuild.builds.create'])
         if defaults['gcp']['schedule_pattern'] != DEFAULT_SCHEDULE_PATTERN:
-            required_permissions.extend(['cloudscheduler.jobs.list', 'cloudscheduler.jobs.create'])
+            required_permissions.extend(['cloudscheduler.jobs.get', 'cloudscheduler.jobs.create'])
         if defaults['gcp']['pipeline_job_submission_service_type'] == PipelineJobSubmitter.CLOUD_RUN.value:
             required_permissions.extend(['run.services.get', 'run.services.create'])
         if defaults['gcp']['pipeline_job_submission_service_type'] == PipelineJobSubmitter.CLOUD_FUNCTIONS.value:
@@ -782,7 +883,7 @@ def precheck_deployment_requirements(defaults: dict):
         deployment_framework = defaults['tooling']['deployment_framework']
 
     credentials, project = google.auth.default()
-    logging.info(f'Checking for required API services in project {project}...')
+    logging.info('Checking for required API services in project %s...', project)
     service = discovery.build('serviceusage', 'v1', credentials=credentials, cache_discovery=False)
     for api in get_required_apis(defaults):
         request = service.services().get(name=f'projects/{project}/services/{api}')
@@ -795,7 +896,7 @@ def precheck_deployment_requirements(defaults: dict):
             raise RuntimeError(f'An error was encountered: {err}') from err
 
     if artifact_repo_type == ArtifactRepository.ARTIFACT_REGISTRY.value:
-        logging.info(f'Checking for Artifact Registry in project {project}...')
+        logging.info('Checking for Artifact Registry in project %s...', project)
         service = discovery.build('artifactregistry', 'v1', credentials=credentials, cache_discovery=False)
         request = service.projects().locations().repositories().get(
             name=f'projects/{project}/locations/{artifact_repo_location}/repositories/{artifact_repo_name}')
@@ -805,7 +906,7 @@ def precheck_deployment_requirements(defaults: dict):
             raise RuntimeError(f'Artifact Registry {artifact_repo_name} not found in project {project}. '
                                 'Please create registry and continue.') from err
 
-    logging.info(f'Checking for Storage Bucket in project {project}...')
+    logging.info('Checking for Storage Bucket in project %s...', project)
     service = discovery.build('storage', 'v1', credentials=credentials, cache_discovery=False)
     request = service.buckets().get(bucket=storage_bucket_name)
     try:
@@ -814,7 +915,7 @@ def precheck_deployment_requirements(defaults: dict):
         raise RuntimeError(f'Storage Bucket {storage_bucket_name} not found in project {project}. '
                             'Please create bucket and continue.') from err
 
-    logging.info(f'Checking for Pipeline Runner Service Account in project {project}...')
+    logging.info('Checking for Pipeline Runner Service Account in project %s...', project)
     service = discovery.build('iam', 'v1', credentials=credentials, cache_discovery=False)
     request = service.projects().serviceAccounts().get(
         name=f'projects/{project}/serviceAccounts/{pipeline_job_runner_service_account}')
@@ -824,7 +925,7 @@ def precheck_deployment_requirements(defaults: dict):
         raise RuntimeError(f'Service Account {pipeline_job_runner_service_account} not found in project {project}. '
                             'Please create service account and continue.') from err
 
-    logging.info(f'Checking for IAM roles on Pipeline Runner Service Account in project {project}...')
+    logging.info('Checking for IAM roles on Pipeline Runner Service Account in project %s...', project)
     service = discovery.build('cloudresourcemanager', 'v1', credentials=credentials, cache_discovery=False)
     request = service.projects().getIamPolicy(
         resource=project, body={'options': {'requestedPolicyVersion': 3}})
@@ -842,7 +943,7 @@ def precheck_deployment_requirements(defaults: dict):
         raise RuntimeError(f'An error was encountered: {err}') from err
 
     if use_ci:
-        logging.info(f'Checking for Pub/Sub Topic in project {project}...')
+        logging.info('Checking for Pub/Sub Topic in project %s...', project)
         service = discovery.build('pubsub', 'v1', credentials=credentials, cache_discovery=False)
         request = service.projects().topics().get(
             topic=f'projects/{project}/topics/{pubsub_topic_name}')
@@ -852,7 +953,7 @@ def precheck_deployment_requirements(defaults: dict):
             raise RuntimeError(f'Pub/Sub Topic {pubsub_topic_name} not found in project {project}. '
                                 'Please create Pub/Sub Topic and continue.') from err
 
-        logging.info(f'Checking for Pub/Sub Subscription in project {project}...')
+        logging.info('Checking for Pub/Sub Subscription in project %s...', project)
         service = discovery.build('pubsub', 'v1', credentials=credentials, cache_discovery=False)
         request = service.projects().subscriptions().get(
             subscription=f'projects/{project}/subscriptions/{pubsub_subscription_name}')
@@ -863,7 +964,7 @@ def precheck_deployment_requirements(defaults: dict):
                                 'Please create Pub/Sub Subscription and continue.') from err
 
         if pipeline_job_submission_service_type == PipelineJobSubmitter.CLOUD_RUN.value:
-            logging.info(f'Checking for Cloud Run Pipeline Job Submission Service in project {project}...')
+            logging.info('Checking for Cloud Run Pipeline Job Submission Service in project %s...', project)
             service = discovery.build('run', 'v1', credentials=credentials, cache_discovery=False)
             request = service.projects().locations().services().get(
                 name=f'projects/{project}/locations/{pipeline_job_submission_service_location}/services/{pipeline_job_submission_service_name}')
@@ -874,7 +975,7 @@ def precheck_deployment_requirements(defaults: dict):
                                     'Please redeploy the submission service and continue.') from err
 
         if pipeline_job_submission_service_type == PipelineJobSubmitter.CLOUD_FUNCTIONS.value:
-            logging.info(f'Checking for Cloud Functions Pipeline Job Submission Service in project {project}...')
+            logging.info('Checking for Cloud Functions Pipeline Job Submission Service in project %s...', project)
             service = discovery.build('cloudfunctions', 'v1', credentials=credentials, cache_discovery=False)
             request = service.projects().locations().functions().get(
                 name=f'projects/{project}/locations/{pipeline_job_submission_service_location}/functions/{pipeline_job_submission_service_name}')
@@ -885,7 +986,7 @@ def precheck_deployment_requirements(defaults: dict):
                                     'Please redeploy the submission service and continue.') from err         
 
         if deployment_framework == Deployer.CLOUDBUILD.value:
-            logging.info(f'Checking for Cloud Build Trigger in project {project}...')
+            logging.info('Checking for Cloud Build Trigger in project %s...', project)
             service = discovery.build('cloudbuild', 'v1', credentials=credentials, cache_discovery=False)
             request = service.projects().locations().triggers().get(
                 name=f'projects/{project}/locations/{build_trigger_location}/triggers/{build_trigger_name}',
@@ -914,14 +1015,13 @@ def resources_generation_manifest(defaults: dict):
                  '#     Generated resources can be found at the following urls    #\n'
                  '#                                                               #\n'
                  '#################################################################\n')
-    # pylint: disable=logging-fstring-interpolation
     logging.info(
-        f'''Google Cloud Storage Bucket: https://console.cloud.google.com/storage/{defaults['gcp']['storage_bucket_name']}''')
+        'Google Cloud Storage Bucket: https://console.cloud.google.com/storage/%s', defaults['gcp']['storage_bucket_name'])
     if defaults['gcp']['artifact_repo_type'] == ArtifactRepository.ARTIFACT_REGISTRY.value:
         logging.info(
-            f'''Artifact Registry: https://console.cloud.google.com/artifacts/docker/{defaults['gcp']['project_id']}/{defaults['gcp']['artifact_repo_location']}/{defaults['gcp']['artifact_repo_name']}''')
+            'Artifact Registry: https://console.cloud.google.com/artifacts/docker/%s/%s/%s', defaults['gcp']['project_id'], defaults['gcp']['artifact_repo_location'], defaults['gcp']['artifact_repo_name'])
     logging.info(
-        f'''Service Accounts: https://console.cloud.google.com/iam-admin/serviceaccounts?project={defaults['gcp']['project_id']}''')
+        'Service Accounts: https://console.cloud.google.com/iam-admin/serviceaccounts?project=%s', defaults['gcp']['project_id'])
     logging.info('APIs: https://console.cloud.google.com/apis')
     if defaults['tooling']['deployment_framework'] == Deployer.CLOUDBUILD.value:
         logging.info('Cloud Build Jobs: https://console.cloud.google.com/cloud-build/builds')
@@ -933,12 +1033,12 @@ def resources_generation_manifest(defaults: dict):
             logging.info('Cloud Build Trigger: https://console.cloud.google.com/cloud-build/triggers')
         if defaults['gcp']['pipeline_job_submission_service_type'] == PipelineJobSubmitter.CLOUD_RUN.value:
             logging.info(
-                f'''Pipeline Job Submission Service (Cloud Run): https://console.cloud.google.com/run/detail/{defaults['gcp']['pipeline_job_submission_service_location']}/{defaults['gcp']['pipeline_job_submission_service_name']}''')
+                'Pipeline Job Submission Service (Cloud Run): https://console.cloud.google.com/run/detail/%s/%s', defaults['gcp']['pipeline_job_submission_service_location'], defaults['gcp']['pipeline_job_submission_service_name'])
         elif defaults['gcp']['pipeline_job_submission_service_type'] == PipelineJobSubmitter.CLOUD_FUNCTIONS.value:
             logging.info(
-                f'''Pipeline Job Submission Service (Cloud Functions): https://console.cloud.google.com/functions/details/{defaults['gcp']['pipeline_job_submission_service_location']}/{defaults['gcp']['pipeline_job_submission_service_name']}''')
+                'Pipeline Job Submission Service (Cloud Functions): https://console.cloud.google.com/functions/details/%s/%s', defaults['gcp']['pipeline_job_submission_service_location'], defaults['gcp']['pipeline_job_submission_service_name'])
         logging.info(
-            f'''Pub/Sub Queueing Service Topic: https://console.cloud.google.com/cloudpubsub/topic/detail/{defaults['gcp']['pubsub_topic_name']}''')
+            'Pub/Sub Queueing Service Topic: https://console.cloud.google.com/cloudpubsub/topic/detail/%s', defaults['gcp']['pubsub_topic_name'])
         logging.info('Pub/Sub Queueing Service Subscriptions: https://console.cloud.google.com/cloudpubsub/subscription/list')
         if defaults['gcp']['schedule_pattern'] != DEFAULT_SCHEDULE_PATTERN:
             logging.info(
@@ -988,15 +1088,15 @@ def git_workflow():
     if not os.path.exists(f'{BASE_DIR}.git'):
 
         # Initialize git and configure credentials
-        execute_process(f'git -C {BASE_DIR} init', to_null=False)
+        execute_process(['git', '-C', BASE_DIR, 'init'], to_null=False)
 
         # Add repo and branch
         execute_process(
-            f'''git -C {BASE_DIR} remote add origin {git_remote_origin_url}''', to_null=False)
+            ['git', '-C', BASE_DIR, 'remote', 'add', 'origin', git_remote_origin_url], to_null=False)
         execute_process(
-            f'''git -C {BASE_DIR} checkout -B {defaults['gcp']['source_repository_branch']}''', to_null=False)
+            ['git', '-C', BASE_DIR, 'checkout', '-B', defaults['gcp']['source_repository_branch']], to_null=False)
         has_remote_branch = subprocess.check_output(
-            [f'''git -C {BASE_DIR} ls-remote origin {defaults['gcp']['source_repository_branch']}'''], shell=True, stderr=subprocess.STDOUT)
+            ['git', '-C', BASE_DIR, 'ls-remote', 'origin', defaults['gcp']['source_repository_branch']], stderr=subprocess.STDOUT)
 
         write_file(
             f'{BASE_DIR}.gitignore',
@@ -1005,26 +1105,25 @@ def git_workflow():
 
         # This will initialize the branch, a second push will be required to trigger the cloudbuild job after initializing
         if not has_remote_branch:
-            execute_process(f'git -C {BASE_DIR} add .gitignore', to_null=False)
-            execute_process(f'''git -C {BASE_DIR} commit -m 'init' ''', to_null=False)
+            execute_process(['git', '-C', BASE_DIR, 'add', '.gitignore'], to_null=False)
+            execute_process(['git', '-C', BASE_DIR, 'commit', '-m', 'init'], to_null=False)
             execute_process(
-                f'''git -C {BASE_DIR} push origin {defaults['gcp']['source_repository_branch']} --force''', to_null=False)
+                ['git', '-C', BASE_DIR, 'push', 'origin', defaults['gcp']['source_repository_branch'], '--force'], to_null=False)
 
     # Check for remote origin url mismatch
     actual_remote = subprocess.check_output(
-        [f'git -C {BASE_DIR} config --get remote.origin.url'], shell=True, stderr=subprocess.STDOUT).decode('utf-8').strip('\n')
+        ['git', '-C', BASE_DIR, 'config', '--get', 'remote.origin.url'], stderr=subprocess.STDOUT).decode('utf-8').strip('\n')
     if actual_remote != git_remote_origin_url:
         raise RuntimeError(
             f'Expected remote origin url {git_remote_origin_url} but found {actual_remote}. Reset your remote origin url to continue.')
 
     # Add, commit, and push changes to CSR
-    execute_process(f'git -C {BASE_DIR} add .', to_null=False)
-    execute_process(f'''git -C {BASE_DIR} commit -m 'Run AutoMLOps' ''', to_null=False)
+    execute_process(['git', '-C', BASE_DIR, 'add', '.'], to_null=False)
+    execute_process(['git', '-C', BASE_DIR, 'commit', '-m', 'Run AutoMLOps'], to_null=False)
     execute_process(
-        f'''git -C {BASE_DIR} push origin {defaults['gcp']['source_repository_branch']} --force''', to_null=False)
-    # pylint: disable=logging-fstring-interpolation
+        ['git', '-C', BASE_DIR, 'push', 'origin', defaults['gcp']['source_repository_branch'], '--force'], to_null=False)
     logging.info(
-        f'''Pushing code to {defaults['gcp']['source_repository_branch']} branch, triggering build...''')
+        'Pushing code to %s branch, triggering build...', defaults['gcp']['source_repository_branch'])
     if deployment_framework == Deployer.CLOUDBUILD.value:
         logging.info(
-            f'''Cloud Build job running at: https://console.cloud.google.com/cloud-build/builds;region={defaults['gcp']['build_trigger_location']}''')
+            'Cloud Build job running at: https://console.cloud.google.com/cloud-build/builds;region=%s', defaults['gcp']['build_trigger_location'])
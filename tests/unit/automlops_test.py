@@ -0,0 +1,416 @@
+# Copyright 2024 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for AutoMLOps module."""
+
+# pylint: disable=line-too-long
+# pylint: disable=redefined-outer-name
+
+import os
+import runpy
+
+import pytest
+import pytest_mock
+
+from google_cloud_automlops import AutoMLOps
+from google_cloud_automlops.deployments.cloudbuild import CloudBuild
+from google_cloud_automlops.provisioning.gcloud import GCloud
+from google_cloud_automlops.utils.constants import (
+    BASE_DIR,
+    GENERATED_CLOUDBUILD_FILE,
+    GENERATED_COMPONENT_BASE,
+    GENERATED_DEFAULTS_FILE,
+    GENERATED_PIPELINE_FILE,
+    GENERATED_RESOURCES_SH_FILE,
+    PINNED_KFP_VERSION
+)
+from google_cloud_automlops.utils.utils import write_file
+
+
+@AutoMLOps.component(packages_to_install=['pandas'])
+def first_step(x: str):
+    """First step.
+
+    Args:
+        x: First input.
+    """
+    print(x)
+
+
+@AutoMLOps.component(packages_to_install=['pandas'])
+def second_step(y: str):
+    """Second step.
+
+    Args:
+        y: Second input.
+    """
+    print(y)
+
+
+@AutoMLOps.component(packages_to_install=['pandas'])
+def unused_step(z: str):
+    """Step registered but not called by the pipeline.
+
+    Args:
+        z: Unused input.
+    """
+    print(z)
+
+
+UNUSED_COMPONENT = AutoMLOps.components_dict['unused_step']
+
+
+@AutoMLOps.pipeline
+def test_pipeline(x: str, y: str):
+    first = first_step(x=x)
+    second_step(y=y).after(first)
+
+
+GENERATE_KWARGS = {
+    'project_id': 'my-project',
+    'pipeline_params': {'x': 'a', 'y': 'b'},
+    'deployment_framework': 'cloud-build',
+    'naming_prefix': 'my-prefix',
+    'use_ci': False
+}
+
+
+@pytest.fixture
+def generated_dir(tmp_path, monkeypatch: pytest.MonkeyPatch, mocker: pytest_mock.MockerFixture):
+    """Runs each test in an empty directory with the test components registered, and spies on
+    the defaults writer so tests can tell whether code generation ran.
+
+    Returns:
+        MagicMock: The spy on AutoMLOps._write_defaults.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(AutoMLOps, 'components_dict', {
+        'first_step': AutoMLOps.components_dict['first_step'],
+        'second_step': AutoMLOps.components_dict['second_step']})
+    monkeypatch.setattr(AutoMLOps, 'pipeline_glob', AutoMLOps.pipeline_glob, raising=False)
+    return mocker.spy(AutoMLOps, '_write_defaults')
+
+
+def test_generate_skips_unchanged_inputs(generated_dir):
+    """Tests that a second generate() with the same inputs keeps the existing output."""
+    defaults = AutoMLOps.generate(**GENERATE_KWARGS)
+    assert generated_dir.call_count == 1
+    assert AutoMLOps.generate(**GENERATE_KWARGS) == defaults
+    assert generated_dir.call_count == 1
+
+
+def test_generate_force(generated_dir):
+    """Tests that force=True regenerates even when nothing changed."""
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    AutoMLOps.generate(**GENERATE_KWARGS, force=True)
+    assert generated_dir.call_count == 2
+
+
+def test_generate_reruns_on_changed_args(generated_dir):
+    """Tests that changing an argument regenerates."""
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    defaults = AutoMLOps.generate(**dict(GENERATE_KWARGS, naming_prefix='other-prefix'))
+    assert generated_dir.call_count == 2
+    assert defaults['gcp']['naming_prefix'] == 'other-prefix'
+
+
+def test_generate_reruns_on_missing_output(generated_dir):
+    """Tests that deleting a generated file makes a same-args generate() run again."""
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    os.remove(GENERATED_PIPELINE_FILE)
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    assert generated_dir.call_count == 2
+    assert os.path.isfile(GENERATED_PIPELINE_FILE)
+
+
+def test_generate_skips_with_unused_component(generated_dir, monkeypatch: pytest.MonkeyPatch):
+    """Tests that a registered component the pipeline does not call, and which therefore gets no
+    generated files, does not prevent a same-args generate() from being skipped."""
+    monkeypatch.setitem(AutoMLOps.components_dict, 'unused_step', UNUSED_COMPONENT)
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    assert not os.path.exists(f'{BASE_DIR}components/unused_step')
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    assert generated_dir.call_count == 1
+
+
+def test_generate_component_requirements(generated_dir):
+    """Tests that explicit packages_to_install are used as given, plus the pinned kfp, without
+    any extra packages the generated code can do without."""
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    with open(f'{GENERATED_COMPONENT_BASE}/requirements.txt', 'r', encoding='utf-8') as file:
+        assert file.read().splitlines() == sorted(['pandas', PINNED_KFP_VERSION])
+
+
+def test_generate_resets_modified_defaults(generated_dir):
+    """Tests that a defaults file modified since the last run (e.g. by monitor()) is reset."""
+    defaults = AutoMLOps.generate(**GENERATE_KWARGS)
+    with open(GENERATED_DEFAULTS_FILE, 'a', encoding='utf-8') as file:
+        file.write('monitoring:\n  target_field: label\n')
+    assert AutoMLOps.generate(**GENERATE_KWARGS) == defaults
+    assert 'monitoring' not in AutoMLOps._read_defaults()
+
+
+def test_generate_digest_inputs(generated_dir, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the generate() digest changes with the arguments, the component source, and the
+    package digest."""
+    package_digest = AutoMLOps._get_package_digest()
+    digest = AutoMLOps._get_generate_digest(GENERATE_KWARGS, package_digest)
+    assert digest == AutoMLOps._get_generate_digest(dict(GENERATE_KWARGS), package_digest)
+    assert digest != AutoMLOps._get_generate_digest(dict(GENERATE_KWARGS, project_id='other'), package_digest)
+    assert digest != AutoMLOps._get_generate_digest(GENERATE_KWARGS, 'other-package-digest')
+
+    comp = AutoMLOps.components_dict['first_step']
+    monkeypatch.setattr(comp, 'src_code', comp.src_code + '\n# changed\n')
+    assert digest != AutoMLOps._get_generate_digest(GENERATE_KWARGS, package_digest)
+
+
+def test_package_digest_computed_once(mocker: pytest_mock.MockerFixture):
+    """Tests that the package walk is only done once per process."""
+    AutoMLOps._get_package_digest()
+    walk = mocker.spy(os, 'walk')
+    AutoMLOps._get_package_digest()
+    assert walk.call_count == 0
+
+
+@pytest.fixture
+def builder_spies(generated_dir, mocker: pytest_mock.MockerFixture):
+    """Spies on the KFP, gcloud, and cloud build builders.
+
+    Returns:
+        dict: The spies, keyed by builder name.
+    """
+    return {
+        'kfp': mocker.spy(AutoMLOps, '_build_kfp'),
+        'gcloud': mocker.spy(GCloud, 'build'),
+        'cloudbuild': mocker.spy(CloudBuild, 'build')}
+
+
+def _call_counts(builder_spies: dict) -> dict:
+    return {name: spy.call_count for name, spy in builder_spies.items()}
+
+
+def test_builder_stamps_skip_unchanged_builders(builder_spies):
+    """Tests that changing only the pipeline parameters reruns only the KFP builder."""
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    AutoMLOps.generate(**dict(GENERATE_KWARGS, pipeline_params={'x': 'c', 'y': 'b'}))
+    assert _call_counts(builder_spies) == {'kfp': 2, 'gcloud': 1, 'cloudbuild': 1}
+
+
+def test_builder_stamps_force(builder_spies):
+    """Tests that force=True reruns every builder."""
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    AutoMLOps.generate(**GENERATE_KWARGS, force=True)
+    assert _call_counts(builder_spies) == {'kfp': 2, 'gcloud': 2, 'cloudbuild': 2}
+
+
+@pytest.mark.parametrize(
+    'deleted_file, rerun_builder',
+    [
+        (GENERATED_PIPELINE_FILE, 'kfp'),
+        (GENERATED_RESOURCES_SH_FILE, 'gcloud'),
+        (GENERATED_CLOUDBUILD_FILE, 'cloudbuild')
+    ]
+)
+def test_builder_stamps_missing_output(builder_spies, deleted_file: str, rerun_builder: str):
+    """Tests that deleting a builder's output reruns only that builder.
+
+    Args:
+        deleted_file (str): Generated file to delete.
+        rerun_builder (str): Builder expected to run again.
+    """
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    os.remove(deleted_file)
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    assert os.path.isfile(deleted_file)
+    expected = {name: 2 if name == rerun_builder else 1 for name in builder_spies}
+    assert _call_counts(builder_spies) == expected
+
+
+def test_builder_stamps_skip_kfp_with_unused_component(builder_spies, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the KFP builder is not rerun because of a registered component the pipeline
+    does not call, when another builder's output is missing."""
+    monkeypatch.setitem(AutoMLOps.components_dict, 'unused_step', UNUSED_COMPONENT)
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    os.remove(GENERATED_CLOUDBUILD_FILE)
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    assert _call_counts(builder_spies) == {'kfp': 1, 'gcloud': 1, 'cloudbuild': 2}
+
+
+def test_builder_stamps_credentials_key_contents(builder_spies):
+    """Tests that rotating the contents of the provisioning credentials key file reruns the
+    provisioning builder, even though its path is unchanged."""
+    with open('key.json', 'w', encoding='utf-8') as file:
+        file.write('{"private_key": "old"}')
+    kwargs = dict(GENERATE_KWARGS, provision_credentials_key='key.json')
+    AutoMLOps.generate(**kwargs)
+    AutoMLOps.generate(**kwargs)
+    assert _call_counts(builder_spies) == {'kfp': 1, 'gcloud': 1, 'cloudbuild': 1}
+    with open('key.json', 'w', encoding='utf-8') as file:
+        file.write('{"private_key": "new"}')
+    AutoMLOps.generate(**kwargs)
+    assert _call_counts(builder_spies) == {'kfp': 1, 'gcloud': 2, 'cloudbuild': 1}
+
+
+def test_pipeline_loads_component_specs(generated_dir, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the generated pipeline.py loads each component from its own component.yaml and
+    compiles, and that editing one of them changes the digest guarding the compiled spec."""
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    monkeypatch.chdir(BASE_DIR)
+    pipeline_module = runpy.run_path('pipelines/pipeline.py')
+    assert pipeline_module['COMPONENT_NAMES'] == ['first_step', 'second_step']
+    for name in pipeline_module['COMPONENT_NAMES']:
+        assert pipeline_module['load_custom_component'](name).name == name.replace('_', '-')
+    pipeline_module['create_training_pipeline'](pipeline_job_spec_path='pipeline_job.yaml')
+    assert os.path.isfile('pipeline_job.yaml')
+
+    digest = pipeline_module['pipeline_sources_digest']()
+    with open('components/first_step/component.yaml', 'a', encoding='utf-8') as file:
+        file.write('# edited\n')
+    assert pipeline_module['pipeline_sources_digest']() != digest
+
+
+@pytest.fixture
+def defaults_file(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Runs each test in an empty directory holding a freshly written defaults file.
+
+    Returns:
+        str: Path to the defaults file.
+    """
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(os.path.dirname(GENERATED_DEFAULTS_FILE))
+    AutoMLOps._load_defaults_cached.cache_clear()
+    AutoMLOps._write_defaults({'gcp': {'project_id': 'my-project'}})
+    return GENERATED_DEFAULTS_FILE
+
+
+def test_read_defaults_uses_sidecar(defaults_file, mocker: pytest_mock.MockerFixture):
+    """Tests that a sidecar matching the defaults file is read instead of parsing the yaml."""
+    read_yaml = mocker.spy(AutoMLOps, 'read_yaml_file')
+    assert AutoMLOps._read_defaults() == {'gcp': {'project_id': 'my-project'}}
+    assert read_yaml.call_count == 0
+
+
+def test_read_defaults_ignores_stale_sidecar(defaults_file):
+    """Tests that a sidecar left over from an earlier version of the defaults file is ignored
+    and rewritten, even when it is newer than the file."""
+    assert AutoMLOps._read_defaults()['gcp']['project_id'] == 'my-project'
+    write_file(defaults_file, 'gcp:\n  project_id: other-project\n', 'w')
+    sidecar_stat = os.stat(defaults_file + '.json')
+    os.utime(defaults_file + '.json', ns=(sidecar_stat.st_atime_ns, os.stat(defaults_file).st_mtime_ns + 10**9))
+
+    assert AutoMLOps._read_defaults()['gcp']['project_id'] == 'other-project'
+    AutoMLOps._load_defaults_cached.cache_clear()
+    assert AutoMLOps._read_defaults()['gcp']['project_id'] == 'other-project'
+
+
+def test_read_defaults_same_mtime_edit(defaults_file):
+    """Tests that an edit keeping both the mtime and the size of the defaults file (as happens on
+    filesystems with coarse timestamps) is still picked up."""
+    assert AutoMLOps._read_defaults()['gcp']['project_id'] == 'my-project'
+    stat = os.stat(defaults_file)
+    with open(defaults_file, 'r', encoding='utf-8') as file:
+        text = file.read()
+    write_file(defaults_file, text.replace('my-project', 'my-pr0ject'), 'w')
+    os.utime(defaults_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(defaults_file).st_size == stat.st_size
+
+    assert AutoMLOps._read_defaults()['gcp']['project_id'] == 'my-pr0ject'
+
+
+def test_read_defaults_returns_copy(defaults_file):
+    """Tests that modifying the returned defaults does not leak into later reads."""
+    defaults = AutoMLOps._read_defaults()
+    defaults['gcp']['project_id'] = 'modified'
+    defaults['extra'] = True
+    assert AutoMLOps._read_defaults() == {'gcp': {'project_id': 'my-project'}}
+
+
+def scaffold_step(x: str = 'a'):
+    """Step decorated by the scaffold cache tests.
+
+    Args:
+        x: Input.
+    """
+    print(x)
+
+
+def scaffold_pipeline(x: str):
+    scaffold_step(x=x)
+
+
+@pytest.fixture
+def scaffold_registry(monkeypatch: pytest.MonkeyPatch):
+    """Gives each test its own component registry, scaffold cache, and pipeline."""
+    monkeypatch.setattr(AutoMLOps, 'components_dict', {})
+    monkeypatch.setattr(AutoMLOps, '_scaffold_cache', {})
+    monkeypatch.setattr(AutoMLOps, 'pipeline_glob', None, raising=False)
+
+
+def _decorate_component(**kwargs):
+    AutoMLOps.component(scaffold_step, **kwargs)
+    return AutoMLOps.components_dict['scaffold_step']
+
+
+def _decorate_pipeline(**kwargs):
+    AutoMLOps.pipeline(scaffold_pipeline, **kwargs)
+    return AutoMLOps.pipeline_glob
+
+
+def test_scaffold_cache_component(scaffold_registry, monkeypatch: pytest.MonkeyPatch):
+    """Tests that redecorating a component only reuses the cached object when the decorator
+    arguments and signature are unchanged."""
+    comp = _decorate_component(packages_to_install=['pandas'])
+    assert _decorate_component(packages_to_install=['pandas']) is comp
+
+    other = _decorate_component(packages_to_install=['pandas', 'numpy'])
+    assert other is not comp
+    assert other.packages_to_install == ['pandas', 'numpy']
+    assert _decorate_component(packages_to_install=['pandas']) is comp
+
+    monkeypatch.setattr(scaffold_step, '__defaults__', ('b',))
+    assert _decorate_component(packages_to_install=['pandas']) is not comp
+
+
+def test_scaffold_cache_pipeline(scaffold_registry):
+    """Tests that redecorating a pipeline only reuses the cached object when its name,
+    description, and components are unchanged."""
+    _decorate_component(packages_to_install=['pandas'])
+    pipe = _decorate_pipeline(name='my-pipeline')
+    assert _decorate_pipeline(name='my-pipeline') is pipe
+
+    renamed = _decorate_pipeline(name='other-pipeline')
+    assert renamed is not pipe
+    assert renamed.name == 'other-pipeline'
+    assert _decorate_pipeline(name='my-pipeline', description='described') is not pipe
+
+    _decorate_component(packages_to_install=['numpy'])
+    assert _decorate_pipeline(name='my-pipeline') is not pipe
+
+
+def test_pipeline_runner_parameter_values_path(generated_dir, monkeypatch: pytest.MonkeyPatch, mocker: pytest_mock.MockerFixture):
+    """Tests that the generated pipeline_runner.py still accepts --parameter_values_path, now with
+    one or more files, and submits one PipelineJob per file."""
+    aiplatform = pytest.importorskip('google.cloud.aiplatform')
+    AutoMLOps.generate(**GENERATE_KWARGS)
+    monkeypatch.chdir(BASE_DIR)
+    for name in ['a', 'b']:
+        write_file(f'{name}.json', f'{{"x": "{name}"}}', 'w')
+    mocker.patch.object(aiplatform, 'init')
+    pipeline_job = mocker.patch.object(aiplatform, 'PipelineJob')
+
+    monkeypatch.setattr('sys.argv', ['pipeline_runner.py', '--config', 'configs/defaults.yaml',
+                                     '--parameter_values_path', 'a.json', 'b.json'])
+    runpy.run_path('pipelines/pipeline_runner.py', run_name='__main__')
+    assert [call.kwargs['parameter_values'] for call in pipeline_job.call_args_list] == [{'x': 'a'}, {'x': 'b'}]
+    assert all(call.kwargs['enable_caching'] for call in pipeline_job.call_args_list)
@@ -22,7 +22,7 @@
 from contextlib import nullcontext as does_not_raise
 import os
 import tempfile
-from typing import Callable, List
+from typing import Callable, List, Union
 
 import pytest
 import pytest_mock
@@ -30,6 +30,8 @@ import yaml
 
 import google_cloud_automlops.utils.utils
 from google_cloud_automlops.utils.utils import (
+    create_default_config,
+    create_default_config_from_dict,
     delete_file,
     execute_process,
     get_function_source_definition,
@@ -42,6 +44,7 @@ from google_cloud_automlops.utils.utils import (
     validate_use_ci,
     write_and_chmod,
     write_file,
+    write_file_if_changed,
     write_yaml_file
 )
 
@@ -172,6 +175,17 @@ def test_write_yaml(filepath: str, mode: str, expectation):
         os.remove(path=filepath)
 
 
+def test_write_yaml_header():
+    """Tests that write_yaml_file writes the given header before the yaml contents."""
+    contents = {'key1': 'value1', 'key2': 'value2'}
+    write_yaml_file(filepath='test.yaml', contents=contents, mode='w', header='# header\n')
+    with open(file='test.yaml', mode='r', encoding='utf-8') as file:
+        text = file.read()
+    assert text.startswith('# header\nkey1: value1\n')
+    assert yaml.safe_load(text) == contents
+    os.remove(path='test.yaml')
+
+
 @pytest.mark.parametrize(
     'filepath, text, write_file_bool, expectation',
     [
@@ -325,18 +339,22 @@ def test_is_component_config(yaml_contents: dict, expectation: bool):
     [
         ('touch test.txt', False, False),
         ('not a real command', False, True),
-        ('echo "howdy"', True, False)
+        ('echo "howdy"', True, False),
+        (['touch', 'test.txt'], False, False),
+        (['not-a-real-command'], False, True)
     ]
 )
-def test_execute_process(command: str, to_null: bool, expectation: bool):
+def test_execute_process(command: Union[str, List[str]], to_null: bool, expectation: bool):
     """Tests execute_process, which executes an external shell process. There
     are two test cases for this function:
         1. A valid command to create a file, which is expected to run successfully.
         2. An invalid command, which is expected to raise a RunTime Error.
         3. A valid command to output a string, which is expected to send output to null
+        4. A valid argv list, which is expected to run without a shell.
+        5. An argv list naming a missing executable, which is expected to raise a RunTime Error.
 
     Args:
-        command (str): Command that is to be executed.
+        command (Union[str, List[str]]): Command that is to be executed.
         expectation (bool): Whether or not an error is expected to be raised.
     """
     if expectation:
@@ -481,3 +499,105 @@ def test_render_jinja(template_string, template_vars, expected_output):
 
         # Assertion
         assert result == expected_output
+
+
+@pytest.mark.parametrize('use_ci', [True, False])
+def test_create_default_config_from_dict(use_ci: bool):
+    """Tests that create_default_config_from_dict builds the expected defaults from a dict of
+    create_default_config arguments, and that create_default_config agrees with it.
+
+    Args:
+        use_ci (bool): Whether the optional CI fields are included.
+    """
+    config = {
+        'artifact_repo_location': 'us-central1',
+        'artifact_repo_name': 'repo',
+        'artifact_repo_type': 'artifact-registry',
+        'base_image': 'python:3.9-slim',
+        'build_trigger_location': 'us-central1',
+        'build_trigger_name': 'trigger',
+        'deployment_framework': 'cloud-build',
+        'naming_prefix': 'prefix',
+        'orchestration_framework': 'kfp',
+        'pipeline_job_location': 'us-central1',
+        'pipeline_job_runner_service_account': 'sa@project.iam.gserviceaccount.com',
+        'pipeline_job_submission_service_location': 'us-central1',
+        'pipeline_job_submission_service_name': 'job-submission-svc',
+        'pipeline_job_submission_service_type': 'cloud-functions',
+        'project_id': 'project',
+        'provisioning_framework': 'gcloud',
+        'pubsub_topic_name': 'queueing-svc',
+        'schedule_location': 'us-central1',
+        'schedule_name': 'schedule',
+        'schedule_pattern': 'No Schedule Specified',
+        'setup_model_monitoring': False,
+        'source_repo_branch': 'automlops',
+        'source_repo_name': 'repository',
+        'source_repo_type': 'github',
+        'storage_bucket_location': 'us-central1',
+        'storage_bucket_name': 'bucket',
+        'use_ci': use_ci,
+        'vpc_connector': 'No VPC Specified'
+    }
+    expected_gcp = {
+        'artifact_repo_location': 'us-central1',
+        'artifact_repo_name': 'repo',
+        'artifact_repo_type': 'artifact-registry',
+        'base_image': 'python:3.9-slim',
+        'naming_prefix': 'prefix',
+        'pipeline_job_location': 'us-central1',
+        'pipeline_job_runner_service_account': 'sa@project.iam.gserviceaccount.com',
+        'project_id': 'project',
+        'setup_model_monitoring': False,
+        'storage_bucket_location': 'us-central1',
+        'storage_bucket_name': 'bucket'
+    }
+    if use_ci:
+        expected_gcp.update({
+            'build_trigger_location': 'us-central1',
+            'build_trigger_name': 'trigger',
+            'pipeline_job_submission_service_location': 'us-central1',
+            'pipeline_job_submission_service_name': 'job-submission-svc',
+            'pipeline_job_submission_service_type': 'cloud-functions',
+            'pubsub_topic_name': 'queueing-svc',
+            'schedule_location': 'us-central1',
+            'schedule_name': 'schedule',
+            'schedule_pattern': 'No Schedule Specified',
+            'source_repository_branch': 'automlops',
+            'source_repository_name': 'repository',
+            'source_repository_type': 'github',
+            'vpc_connector': 'No VPC Specified'
+        })
+    expected = {
+        'gcp': expected_gcp,
+        'pipelines': {
+            'gs_pipeline_job_spec_path': 'gs://bucket/pipeline_root/prefix/pipeline_job.yaml',
+            'parameter_values_path': 'pipelines/runtime_parameters/pipeline_parameter_values.json',
+            'pipeline_component_directory': 'components',
+            'pipeline_job_spec_path': 'scripts/pipeline_spec/pipeline_job.yaml',
+            'pipeline_region': 'us-central1',
+            'pipeline_storage_path': 'gs://bucket/pipeline_root'
+        },
+        'tooling': {
+            'deployment_framework': 'cloud-build',
+            'provisioning_framework': 'gcloud',
+            'orchestration_framework': 'kfp',
+            'use_ci': use_ci
+        }
+    }
+    assert create_default_config_from_dict(config) == expected
+    assert create_default_config(**config) == expected
+
+
+def test_write_file_if_changed():
+    """Tests write_file_if_changed, which writes a file only when its contents differ from the
+    given text, leaving an unchanged file (and its mtime) alone."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        filepath = os.path.join(tmpdirname, 'test.txt')
+        assert write_file_if_changed(filepath, 'first')
+        mtime = os.stat(filepath).st_mtime_ns
+        assert not write_file_if_changed(filepath, 'first')
+        assert os.stat(filepath).st_mtime_ns == mtime
+        assert write_file_if_changed(filepath, 'second')
+        assert read_file(filepath) == 'second'
+        assert os.listdir(tmpdirname) == ['test.txt']